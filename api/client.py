@@ -10,6 +10,16 @@ from core.logger import generate_logid
 
 class APIClient:
     """Base API client with environment support"""
+    
+    # One session (connection pool) shared by every client in the process
+    _shared_session: Optional[requests.Session] = None
+
+    @classmethod
+    def get_shared_session(cls) -> requests.Session:
+        """Get the process-wide requests session, creating it on first use"""
+        if cls._shared_session is None:
+            cls._shared_session = requests.Session()
+        return cls._shared_session
 
     def __init__(self, base_url: str = None, headers: Dict = None, env: str = None, logid: str = None):
         """
@@ -40,9 +50,8 @@ class APIClient:
         else:
             self.headers = self.default_headers
         
-        # Initialize session
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        # Use the shared session; headers are passed per request so clients stay independent
+        self.session = self.get_shared_session()
         
         # Set timeout and retry configuration
         self.timeout = TestEnvironment.get_timeout(self.env)
@@ -83,14 +92,14 @@ class APIClient:
         except Exception as e:
             response_time = time.time() - start_time
             if logger:
-                logger.error(f"GET request failed: {url}", {
+                logger.error(f"GET request failed: {url}", data={
                     "error": str(e),
                     "logid": self.logid,
                     "response_time": response_time
                 })
             else:
                 from core.logger import Log
-                Log.error(f"GET request failed: {url}", {
+                Log.error(f"GET request failed: {url}", data={
                     "error": str(e),
                     "logid": self.logid,
                     "response_time": response_time
@@ -126,7 +135,7 @@ class APIClient:
         except Exception as e:
             response_time = time.time() - start_time
             if logger:
-                logger.error(f"POST request failed: {url}", {
+                logger.error(f"POST request failed: {url}", data={
                     "error": str(e),
                     "logid": self.logid,
                     "response_time": response_time
@@ -162,7 +171,7 @@ class APIClient:
         except Exception as e:
             response_time = time.time() - start_time
             if logger:
-                logger.error(f"PUT request failed: {url}", {
+                logger.error(f"PUT request failed: {url}", data={
                     "error": str(e),
                     "logid": self.logid,
                     "response_time": response_time
@@ -194,7 +203,7 @@ class APIClient:
         except Exception as e:
             response_time = time.time() - start_time
             if logger:
-                logger.error(f"DELETE request failed: {url}", {
+                logger.error(f"DELETE request failed: {url}", data={
                     "error": str(e),
                     "logid": self.logid,
                     "response_time": response_time
@@ -230,7 +239,7 @@ class APIClient:
         except Exception as e:
             response_time = time.time() - start_time
             if logger:
-                logger.error(f"PATCH request failed: {url}", {
+                logger.error(f"PATCH request failed: {url}", data={
                     "error": str(e),
                     "logid": self.logid,
                     "response_time": response_time
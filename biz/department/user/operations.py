@@ -7,6 +7,7 @@ import json
 import time
 from typing import Dict, List, Any, Optional
 from config.settings import TestEnvironment
+from api.client import APIClient
 from core.checker import Checker
 from biz.department.user.checker import UserDataChecker
 
@@ -57,7 +58,7 @@ class UserOperations:
         for attempt in range(self.retry_count):
             start_time = time.time()
             try:
-                response = requests.request(
+                response = APIClient.get_shared_session().request(
                     method=method,
                     url=url,
                     headers=self.headers,
@@ -97,7 +98,7 @@ class UserOperations:
             except requests.exceptions.RequestException as e:
                 response_time = time.time() - start_time
                 from core.logger import Log
-                Log.error(f"Request failed: {str(e)}", {
+                Log.error(f"Request failed: {str(e)}", data={
                     "error": str(e),
                     "response_time": response_time,
                     "attempt": attempt + 1
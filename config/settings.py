@@ -1,6 +1,7 @@
 """
 Global configuration settings for test environments
 """
+import copy
 import os
 import yaml
 from typing import Dict, Any, Optional
@@ -117,6 +118,10 @@ _config_loader = ConfigLoader()
 class TestEnvironment:
     """Test environment configuration with IDC-specific support"""
     
+    # Loaders per IDC and merged configs per (idc, env), built on first use
+    _loaders: Dict[str, ConfigLoader] = {}
+    _configs: Dict[tuple, Dict[str, Any]] = {}
+    
     @classmethod
     def get_current_idc(cls) -> str:
         """Get current IDC"""
@@ -136,17 +141,33 @@ class TestEnvironment:
     def _get_config_loader(cls) -> ConfigLoader:
         """Get current configuration loader"""
         current_idc = cls.get_current_idc()
-        if current_idc != _config_loader.idc_name:
-            # Create new loader if IDC changed
-            return ConfigLoader(current_idc)
-        return _config_loader
+        if current_idc == _config_loader.idc_name:
+            return _config_loader
+        # Create a loader the first time another IDC is used and reuse it afterwards
+        if current_idc not in cls._loaders:
+            cls._loaders[current_idc] = ConfigLoader(current_idc)
+        return cls._loaders[current_idc]
     
     @classmethod
     def get_config(cls, env: str = None) -> Dict[str, Any]:
         """Get configuration for specified environment"""
+        # Return a deep copy so callers can modify the result (nested mappings included) freely
+        return copy.deepcopy(cls._get_cached_config(env))
+    
+    @classmethod
+    def _get_cached_config(cls, env: str = None) -> Dict[str, Any]:
+        """Cached merged configuration for specified environment (read-only for callers)"""
         if env is None:
             env = cls.get_current_env()
         
+        cache_key = (cls.get_current_idc(), env)
+        if cache_key not in cls._configs:
+            cls._configs[cache_key] = cls._build_config(env)
+        return cls._configs[cache_key]
+    
+    @classmethod
+    def _build_config(cls, env: str) -> Dict[str, Any]:
+        """Build merged configuration for specified environment"""
         config_loader = cls._get_config_loader()
         environments = config_loader.get_environments()
         
@@ -172,31 +193,31 @@ class TestEnvironment:
     @classmethod
     def get_host(cls, env: str = None) -> str:
         """Get host URL for specified environment"""
-        config = cls.get_config(env)
+        config = cls._get_cached_config(env)
         return config["host"]
     
     @classmethod
     def get_headers(cls, env: str = None) -> Dict[str, str]:
         """Get default headers for specified environment"""
-        config = cls.get_config(env)
-        return config["headers"].copy()
+        config = cls._get_cached_config(env)
+        return copy.deepcopy(config["headers"])
     
     @classmethod
     def get_timeout(cls, env: str = None) -> int:
         """Get timeout for specified environment"""
-        config = cls.get_config(env)
+        config = cls._get_cached_config(env)
         return config["timeout"]
     
     @classmethod
     def get_retry_count(cls, env: str = None) -> int:
         """Get retry count for specified environment"""
-        config = cls.get_config(env)
+        config = cls._get_cached_config(env)
         return config["retry_count"]
     
     @classmethod
     def get_description(cls, env: str = None) -> str:
         """Get environment description"""
-        config = cls.get_config(env)
+        config = cls._get_cached_config(env)
         return config.get("description", "")
     
     @classmethod
@@ -238,6 +259,7 @@ class TestEnvironment:
     def reload_config(cls):
         """Reload configuration from file"""
         cls._get_config_loader().reload_config()
+        cls._configs.clear()
 
 
 class APIConfig:
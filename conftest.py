@@ -2,10 +2,97 @@
 PTE Framework pytest configuration
 Defines fixtures and configuration for all tests
 """
+import functools
+import os
 import pytest
+from core.allure_compat import allure, set_reporting
+from config.settings import TestEnvironment
 from core.logger import Log, generate_logid
 
 
+# Environment used when TEST_IDC/TEST_ENV are not set explicitly
+_DEFAULT_TEST_ENV = {
+    'TEST_IDC': 'local_test',
+    'TEST_ENV': 'local'
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _pte_env():
+    """Default to the local test IDC and environment once per test session (explicit settings win)"""
+    monkeypatch = pytest.MonkeyPatch()
+    for name, value in _DEFAULT_TEST_ENV.items():
+        if name not in os.environ:
+            monkeypatch.setenv(name, value)
+    yield
+    monkeypatch.undo()
+
+
+@pytest.fixture(scope="module")
+def env_config():
+    """Current environment's host, headers and timeout, resolved once per module"""
+    return {
+        "env": TestEnvironment.get_current_env(),
+        "host": TestEnvironment.get_host(),
+        "headers": TestEnvironment.get_headers(),
+        "timeout": TestEnvironment.get_timeout()
+    }
+
+
+def pytest_configure(config):
+    """Create real allure steps only when allure results are collected (--alluredir)"""
+    set_reporting(bool(config.getoption("allure_report_dir", None)))
+
+
+def pytest_addoption(parser):
+    """Register PTE command line options"""
+    parser.addoption(
+        "--skip-integration",
+        action="store_true",
+        default=False,
+        help="Skip tests marked as integration (fast unit-only runs)"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _allure_label_markers(story, severity):
+    """Build the story/severity markers once per distinct pair"""
+    return allure.story(story), allure.severity(severity)
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Apply allure story/severity labels from a test module's ALLURE_STORIES
+    mapping ({test name: (story, severity_level)}) in a single pass.
+    Entries keyed by the full parametrized name take precedence.
+    Integration tests are skipped when --skip-integration is given.
+    """
+    skip_integration = None
+    if config.getoption("--skip-integration"):
+        skip_integration = pytest.mark.skip(reason="integration tests disabled by --skip-integration")
+    
+    for item in items:
+        if skip_integration and "integration" in item.keywords:
+            item.add_marker(skip_integration)
+            continue
+        
+        stories = getattr(getattr(item, "module", None), "ALLURE_STORIES", None)
+        if not stories:
+            continue
+        labels = stories.get(item.name) or stories.get(getattr(item, "originalname", item.name))
+        if labels:
+            for marker in _allure_label_markers(*labels):
+                item.add_marker(marker)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Expose each phase report on the item as rep_setup/rep_call/rep_teardown"""
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+
 @pytest.fixture(autouse=True)
 def auto_logid(request):
     """
@@ -18,9 +105,8 @@ def auto_logid(request):
     # Get test case name
     testcase_name = request.node.name
     
-    # Reset Log class state to ensure clean LogID
-    Log._current_logid = None
-    Log._logger_instance = None
+    # Reset Log class state to ensure clean LogID (closes files left open by a previous instance)
+    Log.clear_logid()
     Log._current_testcase = testcase_name
     
     # Set LogID for the test
@@ -35,8 +121,36 @@ def auto_logid(request):
     
     yield logid
     
-    # Cleanup after test
-    # Reset Log class state for next test
-    Log._current_logid = None
-    Log._logger_instance = None
+    # Attach logs of tests that did not call Log.end_test
+    Log._output_accumulated_logs(testcase_name)
+    
+    # Cleanup after test: detach and close this test's log files before the
+    # instance is dropped, so later tests' records do not reach them
+    Log.clear_logid()
     Log._current_testcase = None
+
+
+@pytest.fixture
+def log_lifecycle(request, auto_logid):
+    """
+    Log test start/end around the requesting test with its actual outcome.
+    Opt in with @pytest.mark.usefixtures("log_lifecycle") instead of calling
+    Log.start_test/Log.end_test in every test body.
+    """
+    test_name = request.node.name
+    Log.start_test(test_name)
+    
+    yield
+    
+    report = getattr(request.node, "rep_call", None)
+    if report is None:
+        status = "ERROR"
+    elif report.failed:
+        status = "FAILED"
+        crash = getattr(report.longrepr, "reprcrash", None)
+        Log.error(f"{test_name} test failed: {crash.message if crash else report.longreprtext}")
+    elif report.skipped:
+        status = "SKIPPED"
+    else:
+        status = "PASSED"
+    Log.end_test(test_name, status)
@@ -2,7 +2,7 @@
 Core assertion checker - encapsulates pytest assertions
 """
 import json
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 
 class ResponseChecker:
@@ -166,6 +166,21 @@ class Checker:
         Checker.assert_field_exists(data, field_name, message)
         Checker.assert_equal(data[field_name], expected_value, field_name, message)
     
+    @staticmethod
+    def assert_fields(data: Dict, expected: Dict = None, required: Iterable[str] = (), message: str = None):
+        """Assert required fields exist and expected fields have the given values, in one pass"""
+        expected = expected or {}
+        missing = [field for field in required if field not in data]
+        missing += [field for field in expected if field not in data and field not in missing]
+        assert not missing, f"{message or 'Required fields missing'}: {missing}"
+        
+        mismatched = {
+            field: f"expected {value}, got {data[field]}"
+            for field, value in expected.items()
+            if data[field] != value
+        }
+        assert not mismatched, f"{message or 'Field value mismatch'}: {mismatched}"
+    
     @staticmethod
     def assert_dict_equal(actual: Dict, expected: Dict, message: str = None):
         """Assert two dictionaries are equal"""
@@ -179,6 +194,12 @@ class Checker:
         """Assert data is not None"""
         assert data is not None, f"{message or f'{field_name or data} cannot be None'}"
     
+    @staticmethod
+    def assert_all_not_none(values: Dict[str, Any], message: str = None):
+        """Assert no value in a {name: value} mapping is None, reporting all None names at once"""
+        none_names = [name for name, value in values.items() if value is None]
+        assert not none_names, f"{message or 'Values cannot be None'}: {none_names}"
+    
     @staticmethod
     def assert_not_empty(data: Any, field_name: str = None, message: str = None):
         """Assert data is not empty (for strings, lists, dicts)"""
@@ -316,6 +337,14 @@ class Checker:
         Checker.assert_dict_data(data_dict, message)
         assert value in data_dict.values(), \
             f"{message or f'Dictionary should contain value'}: {value}"
+    
+    # ==================== Batch Assertions ====================
+    
+    @staticmethod
+    def assert_all(checks: List[tuple]):
+        """Run several assertions given as (assert_func, *args) tuples, e.g. (Checker.assert_not_none, data, "data")"""
+        for check, *args in checks:
+            check(*args)
 
 
 class ErrorChecker:
@@ -3,14 +3,16 @@ PTE Framework File Logger Module
 Provides file logging functionality with rotation, compression, and retention
 """
 import os
+import atexit
 import logging
 import gzip
+import queue
 import shutil
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Dict, Any
 import threading
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from logging.handlers import BaseRotatingHandler, RotatingFileHandler, TimedRotatingFileHandler, MemoryHandler, QueueHandler, QueueListener
 
 
 class LogFileHandler:
@@ -38,6 +40,7 @@ class LogFileHandler:
         self.retention_days = self.file_config.get('retention_days', 30)
         self.max_size_mb = self.file_config.get('max_size_mb', 100)
         self.enable_compression = self.file_config.get('enable_compression', False)
+        self.buffer_records = self.file_config.get('buffer_records', 0)
         
         # Ensure log directory exists
         self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -91,6 +94,12 @@ class LogFileHandler:
         handler.setLevel(self.level)
         handler.setFormatter(formatter)
         
+        if self.buffer_records > 0:
+            # Buffer records in memory and write them in one batch when the buffer
+            # fills, on an ERROR record, or when the test's logs are flushed
+            handler = BatchMemoryHandler(self.buffer_records, flushLevel=logging.ERROR, target=handler)
+            handler.setLevel(self.level)
+        
         # Add custom filter for level separation
         if self.separate_by_level and level != 'ALL':
             handler.addFilter(LevelFilter(level))
@@ -122,7 +131,8 @@ class LogFileHandler:
             datetime=datetime_str,
             level=level.lower(),
             logid=logid_value,
-            testcase=testcase_value
+            testcase=testcase_value,
+            worker=os.environ.get('PYTEST_XDIST_WORKER', 'main')
         )
         
         return filename
@@ -137,7 +147,7 @@ class LogFileHandler:
             def format(self, record):
                 # Add timestamp if not present
                 if not hasattr(record, 'timestamp'):
-                    record.timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    record.timestamp = self.formatTime(record, '%Y-%m-%d %H:%M:%S')
                 
                 # Add logid if not present
                 if not hasattr(record, 'logid'):
@@ -160,15 +170,16 @@ class LogFileHandler:
             
             def _get_caller_info(self):
                 """Get the real caller info, skipping logger methods"""
-                import inspect
                 import os
+                import sys
                 
-                for frame_info in inspect.stack():
-                    filename = frame_info.filename
-                    lineno = frame_info.lineno
+                frame = sys._getframe(1)
+                while frame is not None:
+                    filename = frame.f_code.co_filename
                     # Skip logger.py and find the real caller
                     if 'logger.py' not in filename and 'file_logger.py' not in filename and 'test' in filename:
-                        return f"{os.path.basename(filename)}:{lineno}"
+                        return f"{os.path.basename(filename)}:{frame.f_lineno}"
+                    frame = frame.f_back
                 return "unknown:0"
         
         return VariableFormatter(self.format_str)
@@ -177,6 +188,20 @@ class LogFileHandler:
         """Get all file handlers"""
         return self.handlers
     
+    def flush(self):
+        """Write out any buffered records"""
+        for handler in self.handlers.values():
+            handler.flush()
+    
+    def close(self):
+        """Write out buffered records and close the log files"""
+        for handler in self.handlers.values():
+            # BatchMemoryHandler.close() flushes but leaves its file handler open
+            target = getattr(handler, 'target', None)
+            handler.close()
+            if target is not None:
+                target.close()
+    
     def cleanup_old_logs(self):
         """Clean up old log files based on retention policy"""
         if self.retention_days <= 0:
@@ -227,6 +252,82 @@ class LevelFilter(logging.Filter):
         return record.levelno == self.level
 
 
+class BatchMemoryHandler(MemoryHandler):
+    """MemoryHandler that writes its buffered records to the file in a single write"""
+    
+    def flush(self):
+        """Format the buffered records and hand them to the target file handler at once"""
+        with self.lock:
+            if self.target is not None and self.buffer:
+                _write_batch(self.target, self.buffer)
+                self.buffer.clear()
+
+
+def _write_batch(handler: logging.Handler, records):
+    """
+    Write records through a file handler with one write and flush per file,
+    instead of StreamHandler.emit()'s write and flush per record.
+    Rollover is checked for every record: a size-rotating handler's file size
+    includes the records still pending in the batch, so it stays within maxBytes.
+    """
+    records = [record for record in records if record.levelno >= handler.level and handler.filter(record)]
+    if not records:
+        return
+    with handler.lock:
+        try:
+            _ensure_stream(handler)
+            max_bytes = handler.maxBytes if isinstance(handler, RotatingFileHandler) else 0
+            size = handler.stream.tell() if max_bytes > 0 else 0
+            pending = []
+            for record in records:
+                text = handler.format(record) + handler.terminator
+                if max_bytes > 0:
+                    rollover = size > 0 and size + len(text) >= max_bytes
+                else:
+                    rollover = isinstance(handler, BaseRotatingHandler) and handler.shouldRollover(record)
+                if rollover:
+                    _write_pending(handler, pending)
+                    handler.doRollover()
+                    _ensure_stream(handler)
+                    size = 0
+                pending.append(text)
+                size += len(text)
+            _write_pending(handler, pending)
+        except Exception:
+            handler.handleError(records[0])
+
+
+def _ensure_stream(handler: logging.FileHandler):
+    """Reopen a file handler's stream (closed, or not yet opened with delay=True)"""
+    if handler.stream is None:
+        handler.setStream(open(handler.baseFilename, handler.mode, encoding=handler.encoding, errors=handler.errors))
+
+
+def _write_pending(handler: logging.FileHandler, pending: list):
+    """Write the formatted records collected so far in a single write and flush"""
+    if pending:
+        handler.stream.write(''.join(pending))
+        handler.stream.flush()
+        pending.clear()
+
+
+class FlushableQueueListener(QueueListener):
+    """QueueListener whose callers can wait until the records queued so far are written"""
+    
+    def flush(self):
+        """Queue a marker behind the pending records and wait until the listener thread reaches it"""
+        written = threading.Event()
+        self.queue.put_nowait(written)
+        written.wait()
+    
+    def handle(self, record):
+        """Write a record, or signal a flush marker once everything queued before it is written"""
+        if isinstance(record, threading.Event):
+            record.set()
+            return
+        super().handle(record)
+
+
 class LogFileManager:
     """Manager for log file operations"""
     
@@ -247,6 +348,13 @@ class LogFileManager:
         
         self.file_handler = LogFileHandler(config, testcase, logid)
         
+        # With async_writes, records are queued by the test thread and written by a listener thread
+        self.async_writes = config.get('file', {}).get('async_writes', False)
+        self._queue_handler = None
+        self._listener = None
+        # Serializes flush() and close(), so a flush marker is never queued behind the stop sentinel
+        self._listener_lock = threading.Lock()
+        
         # Schedule cleanup and compression
         self._schedule_maintenance()
     
@@ -262,17 +370,45 @@ class LogFileManager:
         return self.file_handler.get_handlers()
     
     def add_handlers_to_logger(self, logger: logging.Logger):
-        """Add file handlers to a logger"""
+        """Add file handlers to a logger (a single queue handler when async_writes is enabled)"""
         handlers = self.get_handlers()
+        if self.async_writes:
+            if self._listener is None:
+                log_queue = queue.SimpleQueue()
+                self._queue_handler = QueueHandler(log_queue)
+                self._listener = FlushableQueueListener(log_queue, *handlers.values(), respect_handler_level=True)
+                self._listener.start()
+                atexit.register(self.close)
+            logger.addHandler(self._queue_handler)
+            return
         for handler in handlers.values():
             logger.addHandler(handler)
     
     def remove_handlers_from_logger(self, logger: logging.Logger):
         """Remove file handlers from a logger"""
+        if self._queue_handler is not None:
+            logger.removeHandler(self._queue_handler)
         handlers = self.get_handlers()
         for handler in handlers.values():
             logger.removeHandler(handler)
     
+    def flush(self):
+        """Write out any queued and buffered records"""
+        with self._listener_lock:
+            if self._listener is not None:
+                # Returns once the listener thread has written every record queued so far
+                self._listener.flush()
+        self.file_handler.flush()
+    
+    def close(self):
+        """Stop the listener thread after it drains the queue, then close the log files"""
+        with self._listener_lock:
+            if self._listener is not None:
+                self._listener.stop()
+                self._listener = None
+                atexit.unregister(self.close)
+        self.file_handler.close()
+    
     def cleanup(self):
         """Perform cleanup operations"""
         self.file_handler.cleanup_old_logs()
@@ -3,16 +3,25 @@ PTE Framework Unified Logger Module
 Provides unified logging functionality with logid support for end-to-end tracing
 """
 import logging
-import allure
+import pytest
+from core.allure_compat import allure, step as allure_step
+import json
 import os
+import sys
 import uuid
 import time
-import inspect
-from typing import Optional, Any, Dict, List
+import warnings
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Any, Callable, Dict, List, Union
 from datetime import datetime
 import hashlib
 import random
 import string
+import functools
+import itertools
+import secrets
+from collections import deque
 
 # Import configuration and file logger
 try:
@@ -23,10 +32,193 @@ except ImportError:
     _config_loader = None
     LogFileManager = None
 
+# orjson is optional; fall back to the standard json module when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# TEST_STRICT_LOGID=1 makes generate_logid() fully random per call instead of sequential
+STRICT_LOGID: bool = os.getenv("TEST_STRICT_LOGID", "").lower() in ("1", "true", "yes")
+
+# Level names passed to Log._log_to_allure, resolved once instead of getattr(logging, ...) per record
+_LEVEL_NUMBERS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR
+}
+
+# Structured log data: a dict, or a callable building it only when the record is written
+LogData = Union[Dict, Callable[[], Dict]]
+
+# Wall-clock base captured once; record timestamps are derived from perf_counter_ns
+_BASE_WALL_NS = time.time_ns()
+_BASE_PERF_NS = time.perf_counter_ns()
+
+
+# Pure-Python stand-in for a compiled (Cython) formatting path: PTE has no
+# extension build step, so the per-record strftime is cached instead
+@functools.lru_cache(maxsize=256)
+def _format_second(second: int) -> str:
+    """Format a wall-clock second; cached since records within a second share it"""
+    return datetime.fromtimestamp(second).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _format_timestamp(ts_ns: int) -> str:
+    """Format a nanosecond wall-clock timestamp for log output"""
+    return _format_second(ts_ns // 1_000_000_000)
+
+
+class _LogEntry:
+    """Accumulated log line; instances are recycled through a bounded freelist"""
+    
+    __slots__ = ("ts_ns", "level", "logid", "caller", "message")
+    
+    _freelist: deque = deque()
+    _FREELIST_SIZE = 1024
+    
+    @classmethod
+    def acquire(cls, ts_ns: int, level: str, logid: str, caller: str, message: str) -> '_LogEntry':
+        """Take an entry from the freelist (or allocate one) and fill it"""
+        entry = cls._freelist.pop() if cls._freelist else cls()
+        entry.ts_ns = ts_ns
+        entry.level = level
+        entry.logid = logid
+        entry.caller = caller
+        entry.message = message
+        return entry
+    
+    @classmethod
+    def release(cls, entry: '_LogEntry'):
+        """Return an entry to the freelist once it has been output"""
+        if len(cls._freelist) < cls._FREELIST_SIZE:
+            entry.message = None
+            cls._freelist.append(entry)
+    
+    def as_dict(self) -> Dict[str, str]:
+        """Entry as a structured event (used by buffered logging)"""
+        return {
+            "time": _format_timestamp(self.ts_ns),
+            "level": self.level,
+            "caller": self.caller,
+            "message": self.message
+        }
+    
+    def format(self) -> str:
+        # Format: [timestamp] [INFO level] [LogId] [filename:line] [log content]
+        return f"[{_format_timestamp(self.ts_ns)}] [{self.level}] [{self.logid}] [{self.caller}] {self.message}"
+
+
+def _format_entries(entries: List[_LogEntry]) -> str:
+    """
+    Format a test's accumulated entries as log lines (same format as _LogEntry.format).
+    The "[timestamp] [level] [logid] [" prefix is built once per second/level/logid
+    and reused, since a test's entries mostly share all three.
+    """
+    prefixes = {}
+    lines = []
+    for entry in entries:
+        key = (entry.ts_ns // 1_000_000_000, entry.level, entry.logid)
+        prefix = prefixes.get(key)
+        if prefix is None:
+            prefix = prefixes[key] = f"[{_format_timestamp(entry.ts_ns)}] [{entry.level}] [{entry.logid}] ["
+        lines.append(f"{prefix}{entry.caller}] {entry.message}")
+    return '\n'.join(lines)
+
+
+def _find_caller() -> str:
+    """
+    Get real caller info (file:line), skipping logger frames.
+    Walks frame objects directly instead of inspect.stack(), which reads
+    source context for every frame on the stack.
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        # Skip logger.py and find the real caller
+        if 'logger.py' not in filename and 'test' in filename:
+            return f"{os.path.basename(filename)}:{frame.f_lineno}"
+        frame = frame.f_back
+    return "unknown:0"
+
+
+def _apply_args(message: str, args: tuple, data: Optional[LogData]):
+    """
+    %-format message with args (logging-style), called only for records that are written.
+    A single dict argument fills %(name)s placeholders, as with the logging module.
+    Deprecated: a single dict, list or callable argument with no "%" in the message
+    is the data payload (the earlier Log.info("message", data) form); pass data= instead.
+    """
+    if len(args) == 1:
+        arg = args[0]
+        if data is None and "%" not in message and (isinstance(arg, (dict, list)) or callable(arg)):
+            warnings.warn(
+                "Passing log data positionally is deprecated; pass it as data=",
+                DeprecationWarning,
+                stacklevel=4
+            )
+            return message, arg
+        if isinstance(arg, dict) and arg:
+            return message % arg, data
+    return message % args, data
+
+
+def _serialize_record(message: str, data: Any) -> str:
+    """Serialize a structured log record to JSON in a single pass"""
+    record = {"message": message, **data} if isinstance(data, dict) else {"message": message, "data": data}
+    if orjson is not None:
+        try:
+            return orjson.dumps(record, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits, which only the json module accepts
+            pass
+    return json.dumps(record, default=str, ensure_ascii=False)
+
+
+class _CallerFormatter(logging.Formatter):
+    """Console formatter with real caller info"""
+    
+    def format(self, record):
+        # Get real caller info (skip logger methods) unless Log already passed it
+        if not hasattr(record, 'caller_info'):
+            record.caller_info = _find_caller()
+        
+        # Format: [timestamp] [INFO level] [LogId] [filename:line] [log content]
+        timestamp = self.formatTime(record, '%Y-%m-%d %H:%M:%S')
+        return f"[{timestamp}] [{record.levelname}] [{record.logid}] [{record.caller_info}] {record.getMessage()}"
+
+
+class _LogIdFilter(logging.Filter):
+    """Add the logger instance's logid to records that do not carry one"""
+    
+    def __init__(self, logger_instance):
+        super().__init__()
+        self.logger_instance = logger_instance
+    
+    def filter(self, record):
+        # Log records carry the logid they were logged under (records may be written later)
+        if not hasattr(record, 'logid'):
+            record.logid = self.logger_instance.logid
+        return True
+
 
 class LogIdGenerator:
     """Generate unique 32-character logid for tracing"""
     
+    # Per-process random prefix; sequential logids append an 8-hex-digit counter (32 chars total)
+    _PREFIX = secrets.token_hex(12)
+    _counter = itertools.count()
+    
+    @classmethod
+    def next_logid(cls) -> str:
+        """
+        Return the next sequential logid: per-process random prefix + counter.
+        Unique across processes without hashing or a uuid4 per call.
+        """
+        return f"{cls._PREFIX}{next(cls._counter):08x}"
+    
     @staticmethod
     def generate_logid() -> str:
         """
@@ -58,21 +250,47 @@ class Log:
     Combines functionality from PTELogger, TestLogger, and static Log class.
     """
     
+    __slots__ = ("logger", "_logid", "file_manager", "logging_config")
+    
     # Class-level storage for accumulated logs
     _accumulated_logs = {}
     
-    # Global state management
-    _current_logid: Optional[str] = None
+    # Global state management; the LogID is context-local so threads/tasks can trace separately
+    _logid_var: ContextVar[Optional[str]] = ContextVar("pte_logid", default=None)
     _logger_instance: Optional['Log'] = None
-    _test_start_time: Optional[datetime] = None
+    _test_start_time: Optional[int] = None
     _test_class_name: str = "PTE"
     _current_testcase: Optional[str] = None
     
+    # Fraction of successful high-frequency records (api_call, data_validation)
+    # that are written; failures are always kept. Override via TEST_LOG_SAMPLE_RATE.
+    SAMPLE_RATE: float = float(os.getenv("TEST_LOG_SAMPLE_RATE", "1.0"))
+    
+    # Minimum level written by Log.*; override via TEST_LOG_LEVEL (e.g. WARNING in CI)
+    LEVEL: int = getattr(logging, os.getenv("TEST_LOG_LEVEL", "DEBUG").upper(), logging.DEBUG)
+    
+    _STATUS_EMOJI = {
+        "PASSED": "✅",
+        "FAILED": "❌",
+        "SKIPPED": "⏭️",
+        "ERROR": "💥"
+    }
+    
+    # Passing assertions are not logged unless enabled via TEST_LOG_PASSED_ASSERTIONS
+    LOG_PASSED_ASSERTIONS: bool = os.getenv("TEST_LOG_PASSED_ASSERTIONS", "").lower() in ("1", "true", "yes")
+    
+    # Successful API calls are logged as a summary line only when TEST_LOG_API_PAYLOADS=0
+    LOG_API_PAYLOADS: bool = os.getenv("TEST_LOG_API_PAYLOADS", "1").lower() not in ("0", "false", "no")
+    
+    # With TEST_LOG_BUFFERED=1 records are not written to console/file one by one;
+    # each test's records are written as a single structured record when it ends
+    BUFFERED: bool = os.getenv("TEST_LOG_BUFFERED", "").lower() in ("1", "true", "yes")
+    
     def __init__(self, name: str = "PTE", level: int = logging.INFO, logid: Optional[str] = None):
         """Initialize logger instance (mainly for backward compatibility)"""
         self.logger = logging.getLogger(name)
         self.logger.setLevel(level)
-        self._logid = logid or LogIdGenerator.generate_logid()
+        self._logid = logid or generate_logid()
         
         # Initialize file manager attributes
         self.file_manager = None
@@ -80,12 +298,7 @@ class Log:
         
         # Initialize accumulated logs for this logid
         if self._logid not in self._accumulated_logs:
-            self._accumulated_logs[self._logid] = {
-                'INFO': [],
-                'WARNING': [],
-                'ERROR': [],
-                'DEBUG': []
-            }
+            self._accumulated_logs[self._logid] = []
         
         # Prevent duplicate handlers
         if not self.logger.handlers:
@@ -95,32 +308,42 @@ class Log:
     def _get_instance(cls) -> 'Log':
         """Get or create singleton instance with current LogID"""
         if cls._logger_instance is None:
-            cls._logger_instance = Log("PTE", logid=cls._current_logid)
+            current_logid = cls._logid_var.get()
+            cls._logger_instance = Log("PTE", logid=current_logid)
             # Add LogID attachment when creating logger instance
-            if cls._current_logid:
+            if current_logid:
                 cls._add_logid_attachment("auto_generated")
         return cls._logger_instance
     
     @classmethod
     def set_logid(cls, logid: str):
         """Set current LogID for the session"""
-        cls._current_logid = logid
+        cls._logid_var.set(logid)
         if cls._logger_instance:
             cls._logger_instance.logid = logid
             # Add LogID attachment when setting logid
             cls._add_logid_attachment("auto_generated")
     
+    @classmethod
+    def clear_logid(cls):
+        """Clear current LogID and logger instance (a new LogID is generated on next use)"""
+        cls._logid_var.set(None)
+        if cls._logger_instance is not None:
+            # Detach and close the old instance's log files before dropping it
+            cls._logger_instance.close()
+            cls._logger_instance = None
+    
     @classmethod
     def get_logid(cls) -> str:
-        """Get current LogID"""
-        if cls._current_logid is None:
-            cls._current_logid = LogIdGenerator.generate_logid()
-            # Update logger instance if it exists
-            if cls._logger_instance:
-                cls._logger_instance.logid = cls._current_logid
-                # Add LogID attachment when auto-generating logid
-                cls._add_logid_attachment("auto_generated")
-        return cls._current_logid
+        """Get current LogID (the logger instance's LogID in contexts that have none set, e.g. threads)"""
+        logid = cls._logid_var.get()
+        if logid is None:
+            # The shared instance is not retagged: its LogID keys the test's accumulated logs
+            if cls._logger_instance is not None:
+                return cls._logger_instance.logid
+            logid = LogIdGenerator.generate_logid()
+            cls._logid_var.set(logid)
+        return logid
     
     @classmethod
     def get_headers_with_logid(cls, additional_headers: Optional[Dict] = None) -> Dict[str, str]:
@@ -153,18 +376,23 @@ class Log:
             
             # Initialize accumulated logs for new logid
             if self._logid not in self._accumulated_logs:
-                self._accumulated_logs[self._logid] = {
-                    'INFO': [],
-                    'WARNING': [],
-                    'ERROR': [],
-                    'DEBUG': []
-                }
+                self._accumulated_logs[self._logid] = []
             
             # Recreate handlers for new logid
             self._recreate_handlers()
     
+    def close(self):
+        """Remove this instance's file handlers from the shared logger and close its log files"""
+        if self.file_manager is not None:
+            self.file_manager.remove_handlers_from_logger(self.logger)
+            self.file_manager.close()
+            self.file_manager = None
+    
     def _recreate_handlers(self):
         """Recreate handlers for current logid and testcase"""
+        # Write out and close the previous logid's log files
+        self.close()
+        
         # Remove existing handlers
         for handler in self.logger.handlers[:]:
             self.logger.removeHandler(handler)
@@ -183,39 +411,8 @@ class Log:
             console_handler = logging.StreamHandler()
             console_handler.setLevel(console_level)
             
-            # Create custom formatter with real caller info
-            class CallerFormatter(logging.Formatter):
-                def format(self, record):
-                    # Get real caller info (skip logger methods)
-                    caller_info = self._get_caller_info()
-                    record.caller_info = caller_info
-                    
-                    # Format: [timestamp] [INFO level] [LogId] [filename:line] [log content]
-                    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    return f"[{timestamp}] [{record.levelname}] [{record.logid}] [{record.caller_info}] {record.getMessage()}"
-                
-                def _get_caller_info(self):
-                    """Get the real caller info, skipping logger methods"""
-                    for frame_info in inspect.stack():
-                        filename = frame_info.filename
-                        lineno = frame_info.lineno
-                        # Skip logger.py and find the real caller
-                        if 'logger.py' not in filename and 'test' in filename:
-                            return f"{os.path.basename(filename)}:{lineno}"
-                    return "unknown:0"
-            
-            # Custom filter to add logid
-            class LogIdFilter(logging.Filter):
-                def __init__(self, logger_instance):
-                    super().__init__()
-                    self.logger_instance = logger_instance
-                
-                def filter(self, record):
-                    record.logid = self.logger_instance.logid
-                    return True
-            
-            console_handler.addFilter(LogIdFilter(self))
-            console_handler.setFormatter(CallerFormatter())
+            console_handler.addFilter(_LogIdFilter(self))
+            console_handler.setFormatter(_CallerFormatter())
             
             # Add console handler
             self.logger.addHandler(console_handler)
@@ -253,14 +450,25 @@ class Log:
             }
         }
     
-    def _log_to_allure(self, level: str, message: str, data: Optional[Dict] = None):
-        """Log to Allure and file with logid - optimized format"""
+    def _log_to_allure(self, level: str, message: str, data: Optional[LogData] = None, args: tuple = ()):
+        """Log to Allure and file with logid - optimized format (level is an upper-case name)"""
+        log_level = _LEVEL_NUMBERS[level]
+        if log_level < Log.LEVEL:
+            return
+        
+        # Message arguments are formatted only once the record passes the level gate;
+        # a message without arguments is written as is, even if it contains "%"
+        if args:
+            message, data = _apply_args(message, args, data)
+        
+        # Data may be passed as a callable so it is only built for written records
+        if callable(data):
+            data = data()
+        
         # Get real caller info for logs
         caller_info = self._get_caller_info()
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        ts_ns = Log._now_ns()
         
-        # Format: [timestamp] [INFO level] [LogId] [filename:line] [log content]
-        log_entry = f"[{timestamp}] [{level.upper()}] [{self.logid}] [{caller_info}] {message}"
         
         # Create file manager lazily if needed
         if self.logging_config is None:
@@ -279,49 +487,45 @@ class Log:
                 
                 # Add LogID filter to file handlers
                 for handler in handlers.values():
-                    # Add LogID filter to file handlers
-                    class LogIdFilter(logging.Filter):
-                        def __init__(self, logger_instance):
-                            super().__init__()
-                            self.logger_instance = logger_instance
-                        
-                        def filter(self, record):
-                            record.logid = self.logger_instance.logid
-                            return True
-                    
-                    handler.addFilter(LogIdFilter(self))
+                    handler.addFilter(_LogIdFilter(self))
                 
                 self.file_manager.add_handlers_to_logger(self.logger)
             except Exception as e:
                 # Fallback: log error to console
                 print(f"Warning: Failed to setup file logging: {e}")
         
-        # Log to file using standard logging
-        log_level = getattr(logging, level.upper())
-        self.logger.log(log_level, message)
+        # Log to file using standard logging; caller info is reused by the formatters
+        if not Log.BUFFERED:
+            self.logger.log(log_level, message, extra={"caller_info": caller_info, "logid": self.logid})
         
-        # Add data as separate attachment if provided
+        # Structured data travels with its log line instead of a separate attachment
+        entry_message = message
         if data:
-            allure.attach(
-                str(data),
-                f"DATA: {level.upper()}: {message}",
-                allure.attachment_type.TEXT
-            )
+            entry_message = f"{message}\n    DATA: {_serialize_record(message, data)}"
         
-        # Accumulate logs by level for this logid
-        level_key = level.upper()
-        if level_key in self._accumulated_logs.get(self.logid, {}):
-            self._accumulated_logs[self.logid][level_key].append(log_entry)
+        # Accumulate logs in order for this logid; formatted and attached once per test
+        self._accumulated_logs.setdefault(self.logid, []).append(
+            _LogEntry.acquire(ts_ns, level, self.logid, caller_info, entry_message)
+        )
     
     def _get_caller_info(self) -> str:
         """Get real caller info, skipping logger methods"""
-        for frame_info in inspect.stack():
-            filename = frame_info.filename
-            lineno = frame_info.lineno
-            # Skip logger.py and find the real caller
-            if 'logger.py' not in filename and 'test' in filename:
-                return f"{os.path.basename(filename)}:{lineno}"
-        return "unknown:0"
+        return _find_caller()
+    
+    @staticmethod
+    def _now_ns() -> int:
+        """Current wall-clock time in nanoseconds, derived from perf_counter_ns"""
+        return _BASE_WALL_NS + (time.perf_counter_ns() - _BASE_PERF_NS)
+    
+    @classmethod
+    def is_enabled_for(cls, level: int) -> bool:
+        """Check whether records of the given logging level are written"""
+        return level >= cls.LEVEL
+    
+    @classmethod
+    def _is_sampled(cls) -> bool:
+        """Decide whether a successful high-frequency record should be written"""
+        return cls.SAMPLE_RATE >= 1.0 or random.random() < cls.SAMPLE_RATE
     
     @classmethod
     def _add_logid_attachment(cls, test_name: str):
@@ -335,65 +539,101 @@ class Log:
     
     # Static logging methods (main interface)
     @classmethod
-    def info(cls, message: str, data: Optional[Dict] = None):
-        """Log info message with current LogID"""
-        cls._get_instance()._log_to_allure("INFO", message, data)
+    def info(cls, message: str, *args, data: Optional[LogData] = None):
+        """
+        Log info message with current LogID.
+        Extra args are %-formatted into message only if the record is written
+        (Log.info("User data: %s", user_data)); structured data is passed as data=,
+        either a dict or a callable returning one.
+        """
+        cls._get_instance()._log_to_allure("INFO", message, data, args)
     
     @classmethod
-    def warning(cls, message: str, data: Optional[Dict] = None):
+    def warning(cls, message: str, *args, data: Optional[LogData] = None):
         """Log warning message with current LogID"""
-        cls._get_instance()._log_to_allure("WARNING", message, data)
+        cls._get_instance()._log_to_allure("WARNING", message, data, args)
     
     @classmethod
-    def error(cls, message: str, data: Optional[Dict] = None):
+    def error(cls, message: str, *args, data: Optional[LogData] = None):
         """Log error message with current LogID"""
-        cls._get_instance()._log_to_allure("ERROR", message, data)
+        cls._get_instance()._log_to_allure("ERROR", message, data, args)
     
     @classmethod
-    def debug(cls, message: str, data: Optional[Dict] = None):
-        """Log debug message with current LogID"""
-        cls._get_instance()._log_to_allure("DEBUG", message, data)
+    def debug(cls, message: str, *args, data: Optional[LogData] = None):
+        """Log debug message with current LogID (returns immediately when DEBUG is disabled)"""
+        if cls.LEVEL > logging.DEBUG:
+            return
+        cls._get_instance()._log_to_allure("DEBUG", message, data, args)
     
     @classmethod
     def assertion(cls, description: str, condition: bool, expected: Any = None, actual: Any = None):
-        """Log assertion with current LogID"""
+        """
+        Log assertion with current LogID (passing assertions only when enabled).
+        expected/actual may be callables; they are only evaluated when the assertion fails.
+        """
         if condition:
+            if not cls.LOG_PASSED_ASSERTIONS:
+                return
             cls._get_instance()._log_to_allure("INFO", f"✅ Assertion passed: {description}")
         else:
             error_data = {
                 "description": description,
-                "expected": expected,
-                "actual": actual,
+                "expected": expected() if callable(expected) else expected,
+                "actual": actual() if callable(actual) else actual,
                 "logid": cls.get_logid()
             }
             cls._get_instance()._log_to_allure("ERROR", f"❌ Assertion failed: {description}", error_data)
     
+    @classmethod
+    def assertions(cls, checks):
+        """Log several (description, condition) assertions as a single record"""
+        checks = list(checks)
+        failed = [description for description, condition in checks if not condition]
+        if failed:
+            cls._get_instance()._log_to_allure(
+                "ERROR", f"❌ Assertions failed: {', '.join(failed)}",
+                {"failed": failed, "total": len(checks), "logid": cls.get_logid()}
+            )
+        elif cls.LOG_PASSED_ASSERTIONS:
+            passed = ", ".join(description for description, _ in checks)
+            cls._get_instance()._log_to_allure("INFO", f"✅ Assertions passed: {passed}")
+    
     @classmethod
     def api_call(cls, method: str, url: str, status_code: Optional[int] = None, 
-                 response_time: Optional[float] = None, request_data: Optional[Dict] = None,
-                 response_data: Optional[Dict] = None):
-        """Log API call with current LogID"""
+                 response_time: Optional[float] = None, request_data: Optional[LogData] = None,
+                 response_data: Optional[LogData] = None):
+        """Log API call with current LogID (successful calls are sampled; payloads may be callables)"""
+        succeeded = status_code is None or status_code < 400
+        if succeeded and not cls._is_sampled():
+            return
+        
         message = f"🌐 API Call: {method} {url}"
         if status_code:
             message += f" - Status: {status_code}"
         if response_time:
             message += f" - Time: {response_time:.2f}s"
         
-        data = {
+        if succeeded and not cls.LOG_API_PAYLOADS:
+            cls.info(message)
+            return
+        
+        logid = cls.get_logid()
+        cls.info(message, data=lambda: {
             "method": method,
             "url": url,
             "status_code": status_code,
             "response_time": response_time,
-            "logid": cls.get_logid(),
-            "request_data": request_data,
-            "response_data": response_data
-        }
-        cls.info(message, data)
+            "logid": logid,
+            "request_data": request_data() if callable(request_data) else request_data,
+            "response_data": response_data() if callable(response_data) else response_data
+        })
     
     @classmethod
     def data_validation(cls, field: str, expected: Any, actual: Any, passed: bool):
-        """Log data validation with current LogID"""
+        """Log data validation with current LogID (passed validations are sampled)"""
         if passed:
+            if not cls._is_sampled():
+                return
             cls._get_instance()._log_to_allure("INFO", f"✅ Data validation passed: {field}")
         else:
             error_data = {
@@ -409,7 +649,7 @@ class Log:
         """Decorator for Allure steps with logid logging"""
         def decorator(func):
             def wrapper(*args, **kwargs):
-                with allure.step(f"[LOGID:{cls.get_logid()}] {step_name}"):
+                with allure_step(f"[LOGID:{cls.get_logid()}] {step_name}"):
                     cls.info(f"Starting step: {step_name}")
                     try:
                         result = func(*args, **kwargs)
@@ -432,22 +672,16 @@ class Log:
     @classmethod
     def test_complete(cls, test_name: str, status: str = "PASSED"):
         """Log test completion with current LogID"""
-        status_emoji = {
-            "PASSED": "✅",
-            "FAILED": "❌", 
-            "SKIPPED": "⏭️",
-            "ERROR": "💥"
-        }
-        emoji = status_emoji.get(status.upper(), "📝")
+        emoji = cls._STATUS_EMOJI.get(status.upper(), "📝")
         cls._get_instance()._log_to_allure("INFO", f"{emoji} Test completed: {test_name} - {status}")
         
-        # Output accumulated logs as consolidated attachments
-        cls._output_accumulated_logs()
+        # Output accumulated logs as a single attachment
+        cls._output_accumulated_logs(test_name)
     
     @classmethod
     def start_test(cls, test_method_name: str):
         """Start test logging with current LogID"""
-        cls._test_start_time = datetime.now()
+        cls._test_start_time = cls._now_ns()
         test_name = f"{cls._test_class_name}.{test_method_name}"
         cls.test_start(test_name)
     
@@ -456,30 +690,69 @@ class Log:
         """End test logging with current LogID"""
         test_name = f"{cls._test_class_name}.{test_method_name}"
         if cls._test_start_time:
-            duration = (datetime.now() - cls._test_start_time).total_seconds()
+            duration = (cls._now_ns() - cls._test_start_time) / 1e9
             cls.info(f"⏱️ Test duration: {duration:.2f} seconds")
         
         cls.test_complete(test_name, status)
     
     @classmethod
-    def _output_accumulated_logs(cls):
-        """Output accumulated logs as consolidated attachments"""
+    @contextmanager
+    def test(cls, test_method_name: str):
+        """
+        Run a test body and log its start/end as one record with duration
+        (use instead of a Log.start_test/Log.end_test pair; status comes from the body's outcome)
+        """
+        test_name = f"{cls._test_class_name}.{test_method_name}"
+        start = time.perf_counter()
+        status = "FAILED"
+        try:
+            yield
+            status = "PASSED"
+        except pytest.skip.Exception:
+            # pytest.skip() raises a BaseException subclass; log the test as skipped, not failed
+            status = "SKIPPED"
+            raise
+        except Exception as e:
+            cls.error(f"Test failed: {test_name}", data={
+                "test": test_name,
+                "error": str(e),
+                "exc_type": type(e).__name__
+            })
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            emoji = cls._STATUS_EMOJI[status]
+            cls._get_instance()._log_to_allure(
+                "INFO", f"{emoji} Test completed: {test_name} - {status} ({duration:.2f}s)"
+            )
+            cls._output_accumulated_logs(test_name)
+    
+    @classmethod
+    def _output_accumulated_logs(cls, test_name: Optional[str] = None):
+        """Output accumulated logs as one attachment (and one record when buffered) per test"""
         logid = cls.get_logid()
-        if logid in cls._accumulated_logs:
-            logs = cls._accumulated_logs[logid]
-            
-            # Create consolidated log files by level
-            for level, entries in logs.items():
-                if entries:
-                    consolidated_content = '\n'.join(entries)
-                    allure.attach(
-                        consolidated_content,
-                        f"CONSOLIDATED_{level}_LOGS",
-                        allure.attachment_type.TEXT
-                    )
-            
-            # Clean up accumulated logs for this logid
-            del cls._accumulated_logs[logid]
+        entries = cls._accumulated_logs.pop(logid, None)
+        if entries:
+            if cls.BUFFERED:
+                # One structured console/file record per test instead of one per call,
+                # at the highest level among its entries so console filtering still applies
+                level = max(_LEVEL_NUMBERS[entry.level] for entry in entries)
+                cls._get_instance().logger.log(level, _serialize_record(
+                    f"Test log: {test_name or logid}",
+                    {"test": test_name, "logid": logid, "events": [entry.as_dict() for entry in entries]}
+                ), extra={"logid": logid})
+            allure.attach(
+                _format_entries(entries),
+                f"log-{test_name or logid}",
+                allure.attachment_type.TEXT
+            )
+            for entry in entries:
+                _LogEntry.release(entry)
+        
+        # Write out the test's buffered file records
+        file_manager = cls._get_instance().file_manager
+        if file_manager is not None:
+            file_manager.flush()
     
     @classmethod
     def raw(cls, message: str, *args, **kwargs):
@@ -503,8 +776,10 @@ class Log:
 
 # Backward compatibility aliases
 def generate_logid() -> str:
-    """Generate a new logid"""
-    return LogIdGenerator.generate_logid()
+    """Generate a new logid (fully random per call when TEST_STRICT_LOGID is set)"""
+    if STRICT_LOGID:
+        return LogIdGenerator.generate_logid()
+    return LogIdGenerator.next_logid()
 
 
 # # Legacy class aliases for backward compatibility
@@ -0,0 +1,70 @@
+"""
+Checker batch assertion tests
+Covers assert_fields, assert_all_not_none and assert_all, including their failure messages
+"""
+import pytest
+from core.checker import Checker
+
+
+USER = {"id": 1, "name": "John Smith", "email": "john.smith@example.com"}
+
+
+def test_assert_fields_passes():
+    """Present required fields and matching expected values pass"""
+    Checker.assert_fields(USER, {"name": "John Smith"}, required=["id", "email"])
+
+
+def test_assert_fields_reports_all_missing_fields():
+    """Missing required and expected fields are reported together"""
+    with pytest.raises(AssertionError, match=r"^Required fields missing: \['age', 'status'\]$"):
+        Checker.assert_fields(USER, {"status": "active"}, required=["id", "age"])
+
+
+def test_assert_fields_reports_all_mismatched_values():
+    """Every mismatched field is reported with its expected and actual value"""
+    with pytest.raises(AssertionError) as exc_info:
+        Checker.assert_fields(USER, {"id": 2, "name": "Jane Doe", "email": "john.smith@example.com"})
+    assert str(exc_info.value) == \
+        "Field value mismatch: {'id': 'expected 2, got 1', 'name': 'expected Jane Doe, got John Smith'}"
+
+
+def test_assert_fields_custom_message():
+    """A custom message replaces the default failure prefix"""
+    with pytest.raises(AssertionError, match=r"^User fields: \['age'\]$"):
+        Checker.assert_fields(USER, required=["age"], message="User fields")
+
+
+def test_assert_all_not_none_passes():
+    """A mapping without None values passes"""
+    Checker.assert_all_not_none({"api_client": object(), "user_ops": object()})
+
+
+def test_assert_all_not_none_reports_all_none_names():
+    """Every None entry is reported by name in one failure"""
+    with pytest.raises(AssertionError, match=r"^Values cannot be None: \['api_client', 'test_data'\]$"):
+        Checker.assert_all_not_none({"api_client": None, "user_ops": object(), "test_data": None})
+
+
+def test_assert_all_not_none_custom_message():
+    """A custom message replaces the default failure prefix"""
+    with pytest.raises(AssertionError, match=r"^Fixtures missing: \['user_ops'\]$"):
+        Checker.assert_all_not_none({"user_ops": None}, "Fixtures missing")
+
+
+def test_assert_all_passes():
+    """Every check in the batch is run"""
+    Checker.assert_all([
+        (Checker.assert_equal, USER["id"], 1, "id"),
+        (Checker.assert_not_none, USER, "user"),
+        (Checker.assert_field_exists, USER, "email")
+    ])
+
+
+def test_assert_all_raises_first_failure():
+    """The first failing check's own message is raised unchanged"""
+    with pytest.raises(AssertionError, match=r"^Value mismatch for name: expected Jane Doe, got John Smith$"):
+        Checker.assert_all([
+            (Checker.assert_not_none, USER, "user"),
+            (Checker.assert_equal, USER["name"], "Jane Doe", "name"),
+            (Checker.assert_equal, USER["id"], 2, "id")
+        ])
@@ -0,0 +1,53 @@
+"""
+File logger unit tests
+Covers queued (async) writes and batched writes with rollover
+"""
+import logging
+from logging.handlers import RotatingFileHandler
+from core.file_logger import LogFileManager, _write_batch
+
+
+def test_async_writes_drained_on_flush(tmp_path):
+    """Records queued for the writer thread are in the log file once the manager is flushed"""
+    config = {
+        "file": {
+            "directory": str(tmp_path),
+            "filename_format": "pte_{logid}_{level}.log",
+            "rotate_by_date": False,
+            "async_writes": True
+        }
+    }
+    manager = LogFileManager(config, "async_writes", "asynclogid")
+    logger = logging.getLogger("PTE.async_writes")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    manager.add_handlers_to_logger(logger)
+    
+    try:
+        for i in range(50):
+            logger.info("Queued record %d", i)
+        manager.flush()
+        
+        lines = (tmp_path / "pte_asynclogid_all.log").read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 50
+        assert lines[-1].endswith("Queued record 49")
+    finally:
+        manager.remove_handlers_from_logger(logger)
+        manager.close()
+
+
+def test_batch_write_rolls_over_within_max_bytes(tmp_path):
+    """A batch larger than maxBytes is split across rotated files instead of overfilling one"""
+    handler = RotatingFileHandler(tmp_path / "batch.log", maxBytes=200, backupCount=10, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    records = [logging.makeLogRecord({"msg": f"Batched record {i:02d}", "levelno": logging.INFO}) for i in range(40)]
+    
+    try:
+        _write_batch(handler, records)
+    finally:
+        handler.close()
+    
+    log_files = list(tmp_path.glob("batch.log*"))
+    assert len(log_files) > 1
+    assert all(path.stat().st_size <= 200 for path in log_files)
+    assert sum(len(path.read_text(encoding="utf-8").splitlines()) for path in log_files) == 40
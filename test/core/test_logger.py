@@ -0,0 +1,126 @@
+"""
+Logger unit tests
+Covers Log.test outcomes, message formatting, LogID handling and per-test log handlers
+"""
+import logging
+import threading
+import pytest
+from core.logger import Log
+
+
+@pytest.fixture
+def completed_test_logs(monkeypatch):
+    """Messages Log.test hands over for attachment, captured instead of attached"""
+    monkeypatch.setattr(Log, "LEVEL", logging.DEBUG)
+    messages = []
+    
+    def capture(test_name=None):
+        messages.extend(entry.message for entry in Log._accumulated_logs.pop(Log.get_logid(), []))
+    
+    monkeypatch.setattr(Log, "_output_accumulated_logs", capture)
+    return messages
+
+
+def test_log_test_passed(completed_test_logs):
+    """Log.test records a body that completes as PASSED"""
+    with Log.test("passing_body"):
+        Log.info("Body ran")
+    
+    assert completed_test_logs[-2] == "Body ran"
+    assert "passing_body - PASSED" in completed_test_logs[-1]
+
+
+def test_log_test_failed(completed_test_logs):
+    """Log.test logs the error, records FAILED and re-raises"""
+    with pytest.raises(ValueError, match="boom"):
+        with Log.test("failing_body"):
+            raise ValueError("boom")
+    
+    assert completed_test_logs[-2].startswith("Test failed: ")
+    assert "boom" in completed_test_logs[-2]
+    assert "failing_body - FAILED" in completed_test_logs[-1]
+
+
+def test_log_test_skipped(completed_test_logs):
+    """Log.test records a pytest.skip() in its body as SKIPPED and lets the skip through"""
+    with pytest.raises(pytest.skip.Exception):
+        with Log.test("skipped_body"):
+            pytest.skip("not applicable")
+    
+    assert "skipped_body - SKIPPED" in completed_test_logs[-1]
+
+
+def test_percent_in_log_messages(monkeypatch):
+    """Messages containing "%" are written as is unless they are given message arguments"""
+    monkeypatch.setattr(Log, "LEVEL", logging.DEBUG)
+    
+    Log.info("100% done", data={"progress": 100})
+    Log.error("GET request failed: /api/users?name=a%20b", data={"error": "timeout"})
+    Log.api_call("GET", "/api/users?name=a%20b", 500, 0.1, response_data={"error": "server error"})
+    Log.info("Progress: %d%%", 50)
+    Log.info("Host %(host)s", {"host": "localhost"})
+    
+    # First line of each record (structured data follows on the next line)
+    messages = [entry.message.split("\n")[0] for entry in Log._accumulated_logs[Log.get_logid()]]
+    assert messages[-5:] == [
+        "100% done",
+        "GET request failed: /api/users?name=a%20b",
+        "🌐 API Call: GET /api/users?name=a%20b - Status: 500 - Time: 0.10s",
+        "Progress: 50%",
+        "Host localhost"
+    ]
+
+
+def test_positional_data_is_deprecated(monkeypatch):
+    """A positional dict with no "%" in the message is still logged as data, with a DeprecationWarning"""
+    monkeypatch.setattr(Log, "LEVEL", logging.DEBUG)
+    
+    with pytest.deprecated_call():
+        Log.info("User data", {"user_id": 12345})
+    
+    message = Log._accumulated_logs[Log.get_logid()][-1].message
+    assert message.startswith("User data\n")
+    assert "12345" in message
+
+
+def test_logid_in_worker_thread():
+    """Logging from a worker thread uses the test's LogID and keeps its accumulated logs"""
+    logid = Log.get_logid()
+    thread_logids = []
+    
+    def worker():
+        Log.info("Log from worker thread")
+        thread_logids.append(Log.get_logid())
+    
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    
+    assert thread_logids == [logid]
+    assert Log.get_logid() == logid
+    assert Log._get_instance().logid == logid
+
+
+@pytest.mark.parametrize("run", [1, 2])
+def test_log_handlers_belong_to_current_test(run):
+    """Only the current test's file handlers are attached (earlier tests' log files are detached)"""
+    Log.info("Log handler isolation check %d", run)
+    
+    instance = Log._get_instance()
+    file_handlers = [handler for handler in instance.logger.handlers if type(handler) is not logging.StreamHandler]
+    own_handlers = list(instance.file_manager.get_handlers().values()) if instance.file_manager else []
+    assert len(file_handlers) <= len(own_handlers), \
+        f"Log handlers of earlier tests are still attached: {file_handlers}"
+
+
+def test_end_test_logs_elapsed_duration(completed_test_logs, monkeypatch):
+    """Log.end_test records the time elapsed on the logger's clock since Log.start_test"""
+    now_ns = [1_000_000_000]
+    monkeypatch.setattr(Log, "_now_ns", staticmethod(lambda: now_ns[0]))
+    monkeypatch.setattr(Log, "_test_start_time", None)
+    
+    Log.start_test("timed_body")
+    now_ns[0] += 100_000_000
+    Log.end_test("timed_body")
+    
+    assert "⏱️ Test duration: 0.10 seconds" in completed_test_logs
@@ -0,0 +1,33 @@
+"""
+User module pytest configuration
+Shared user components, built once per test session
+"""
+import pytest
+from api.client import APIClient
+from biz.department.user.operations import UserOperations
+from data.department.user.test_data import UserTestData
+from biz.department.user.checker import UserErrorChecker
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """API client shared by the user tests"""
+    return APIClient()
+
+
+@pytest.fixture(scope="session")
+def user_ops():
+    """User business operations shared by the user tests"""
+    return UserOperations()
+
+
+@pytest.fixture(scope="session")
+def test_data():
+    """User test data (static payloads on UserTestData)"""
+    return UserTestData()
+
+
+@pytest.fixture(scope="session")
+def user_checker():
+    """User error checker shared by the user tests"""
+    return UserErrorChecker()
@@ -4,590 +4,364 @@ PTE Business Real API Tests
 Real API integration tests for user business operations
 """
 import pytest
-import allure
-import os
-from config.settings import TestEnvironment
-from api.client import APIClient
-from biz.department.user.operations import UserOperations
+from core.allure_compat import allure
+from types import SimpleNamespace
 from data.department.user.test_data import UserTestData
 from core.checker import Checker
-from core.logger import Log, generate_logid
-from biz.department.user.checker import UserErrorChecker
+from core.logger import Log
 
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.parallel,
+    pytest.mark.usefixtures("log_lifecycle"),
+    allure.epic("PTE Framework"),
+    allure.feature("Business Real API")
+]
 
-@allure.epic("PTE Framework")
-@allure.feature("Business Real API")
-class TestBusinessRealAPI:
-    """PTE Business Real API Tests"""
-    
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        """Setup test environment"""
-        os.environ['TEST_IDC'] = 'local_test'
-        os.environ['TEST_ENV'] = 'local'
-        
-        # Initialize components
-        self.api_client = APIClient()
-        self.user_ops = UserOperations()
-        self.test_data = UserTestData()
-    
-    @allure.story("Real API Connection")
-    @allure.severity(allure.severity_level.CRITICAL)
-    def test_real_api_connection(self):
-        """Test real API connection"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_real_api_connection")
-        
-        try:
-            with allure.step("Verify real API connection"):
-                Log.info("\n=== Real API Connection Test ===")
-                
-                # Test API client initialization
-                Checker.assert_not_none(self.api_client, "api_client")
-                Log.info("1. API Client Initialization")
-                Log.info("   ✅ API client initialized successfully")
-                
-                # Test host configuration
-                host = TestEnvironment.get_host()
-                Checker.assert_not_none(host, "host")
-                Checker.assert_attr_equal(self.api_client, 'host', host)
-                Log.info(f"2. Host Configuration: {host}")
-                Log.info("   ✅ Host configuration correct")
-                
-                # Test headers configuration
-                headers = TestEnvironment.get_headers()
-                Checker.assert_not_none(headers, "headers")
-                
-                # Check that API client headers contain the original headers plus logId
-                Checker.assert_contains(self.api_client.headers, 'logId')  # API client should have logId
-                # Remove logId for comparison with original headers
-                api_headers_without_logid = {k: v for k, v in self.api_client.headers.items() if k != 'logId'}
-                Checker.assert_dict_equal(api_headers_without_logid, headers)
-                Log.info(f"3. Headers Configuration: {headers}")
-                Log.info("   ✅ Headers configuration correct")
-                
-                # Test timeout configuration
-                timeout = TestEnvironment.get_timeout()
-                Checker.assert_true(timeout > 0, "timeout should be greater than 0")
-                Log.info(f"4. Timeout Configuration: {timeout} seconds")
-                Log.info("   ✅ Timeout configuration correct")
-                
-                Log.info("   🎉 Real API connection test completed")
-                
-        except Exception as e:
-            Log.error(f"test_real_api_connection test failed: {str(e)}")
-            Log.end_test("test_real_api_connection", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_real_api_connection", "PASSED")
-    
-    @allure.story("User Creation API")
-    @allure.severity(allure.severity_level.CRITICAL)
-    def test_user_creation_api(self):
-        """Test user creation via real API"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_user_creation_api")
-        
-        try:
-            with allure.step("Test user creation via real API"):
-                Log.info("\n=== User Creation API Test ===")
-                
-                # Get test data
-                user_data = self.test_data.VALID_USER_1  # Use static property
-                
-                Log.info("1. Test Data Preparation")
-                Log.info(f"   User data: {user_data}")
-                Log.info("   ✅ Test data prepared")
-                
-                # Test user creation
-                Log.info("2. User Creation via API")
-                try:
-                    # This would be a real API call in actual implementation
-                    # response = self.user_ops.create_user(user_data)
-                    Log.info("   - API call would be made here")
-                    Log.info("   - User creation request sent")
-                    Log.info("   - Response validation performed")
-                    Log.info("   ✅ User creation API test structure")
-                except Exception as e:
-                    Log.info(f"   ⚠️  API call simulation: {type(e).__name__}")
-                
-                # Validate response structure
-                Log.info("3. Response Validation")
-                Log.info("   - Status code validation")
-                Log.info("   - Response body validation")
-                Log.info("   - Error handling validation")
-                Log.info("   ✅ Response validation structure")
-                
-                Log.info("   🎉 User creation API test completed")
-                
-        except Exception as e:
-            Log.error(f"test_user_creation_api test failed: {str(e)}")
-            Log.end_test("test_user_creation_api", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_user_creation_api", "PASSED")
-    
-    @allure.story("User Retrieval API")
-    @allure.severity(allure.severity_level.NORMAL)
-    def test_user_retrieval_api(self):
-        """Test user retrieval via real API"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_user_retrieval_api")
-        
-        try:
-            with allure.step("Test user retrieval via real API"):
-                Log.info("\n=== User Retrieval API Test ===")
-                
-                # Test get all users
-                Log.info("1. Get All Users API")
-                try:
-                    # This would be a real API call
-                    # response = self.user_ops.get_all_users()
-                    Log.info("   - API call would be made here")
-                    Log.info("   - Users list request sent")
-                    Log.info("   - Response processing performed")
-                    Log.info("   ✅ Get all users API test structure")
-                except Exception as e:
-                    Log.info(f"   ⚠️  API call simulation: {type(e).__name__}")
-                
-                # Test get user by ID
-                Log.info("2. Get User by ID API")
-                test_user_id = 1
-                try:
-                    # This would be a real API call
-                    # response = self.user_ops.get_user_by_id(test_user_id)
-                    Log.info(f"   - API call for user ID {test_user_id}")
-                    Log.info("   - User details request sent")
-                    Log.info("   - Response validation performed")
-                    Log.info("   ✅ Get user by ID API test structure")
-                except Exception as e:
-                    Log.info(f"   ⚠️  API call simulation: {type(e).__name__}")
-                
-                Log.info("   🎉 User retrieval API test completed")
-                
-        except Exception as e:
-            Log.error(f"test_user_retrieval_api test failed: {str(e)}")
-            Log.end_test("test_user_retrieval_api", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_user_retrieval_api", "PASSED")
-    
-    @allure.story("User Update API")
-    @allure.severity(allure.severity_level.NORMAL)
-    def test_user_update_api(self):
-        """Test user update via real API"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_user_update_api")
-        
-        try:
-            with allure.step("Test user update via real API"):
-                Log.info("\n=== User Update API Test ===")
-                
-                # Get update test data
-                update_data = self.test_data.UPDATE_NAME_ONLY  # Use static property
-                
-                Log.info("1. Update Data Preparation")
-                Log.info(f"   Update data: {update_data}")
-                Log.info("   ✅ Update data prepared")
-                
-                # Test user update
-                Log.info("2. User Update via API")
-                test_user_id = 1
-                try:
-                    # This would be a real API call
-                    # response = self.user_ops.update_user(test_user_id, update_data)
-                    Log.info(f"   - API call for user ID {test_user_id}")
-                    Log.info("   - User update request sent")
-                    Log.info("   - Response validation performed")
-                    Log.info("   ✅ User update API test structure")
-                except Exception as e:
-                    Log.info(f"   ⚠️  API call simulation: {type(e).__name__}")
-                
-                # Validate update response
-                Log.info("3. Update Response Validation")
-                Log.info("   - Status code validation")
-                Log.info("   - Updated data verification")
-                Log.info("   - Change confirmation")
-                Log.info("   ✅ Update response validation structure")
-                
-                Log.info("   🎉 User update API test completed")
-                
-        except Exception as e:
-            Log.error(f"test_user_update_api test failed: {str(e)}")
-            Log.end_test("test_user_update_api", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_user_update_api", "PASSED")
-    
-    @allure.story("User Deletion API")
-    @allure.severity(allure.severity_level.CRITICAL)
-    def test_user_deletion_api(self):
-        """Test user deletion via real API"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_user_deletion_api")
-        
-        try:
-            with allure.step("Test user deletion via real API"):
-                Log.info("\n=== User Deletion API Test ===")
-                
-                # Test user deletion
-                Log.info("1. User Deletion via API")
-                test_user_id = 1
-                try:
-                    # This would be a real API call
-                    # response = self.user_ops.delete_user(test_user_id)
-                    Log.info(f"   - API call for user ID {test_user_id}")
-                    Log.info("   - User deletion request sent")
-                    Log.info("   - Response validation performed")
-                    Log.info("   ✅ User deletion API test structure")
-                except Exception as e:
-                    Log.info(f"   ⚠️  API call simulation: {type(e).__name__}")
-                
-                # Validate deletion response
-                Log.info("2. Deletion Response Validation")
-                Log.info("   - Status code validation")
-                Log.info("   - Deletion confirmation")
-                Log.info("   - User existence verification")
-                Log.info("   ✅ Deletion response validation structure")
-                
-                Log.info("   🎉 User deletion API test completed")
-                
-        except Exception as e:
-            Log.error(f"test_user_deletion_api test failed: {str(e)}")
-            Log.end_test("test_user_deletion_api", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_user_deletion_api", "PASSED")
-    
-    @allure.story("API Error Handling")
-    @allure.severity(allure.severity_level.NORMAL)
-    def test_api_error_handling(self):
-        """Test API error handling"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_api_error_handling")
-        
-        try:
-            with allure.step("Test API error handling"):
-                Log.info("\n=== API Error Handling Test ===")
-                
-                # Test invalid user data
-                Log.info("1. Invalid User Data Test")
-                invalid_user = self.test_data.INVALID_USER_NO_NAME  # Use static property
-                
-                try:
-                    # This would trigger an error in real API
-                    # response = self.user_ops.create_user(invalid_user)
-                    Log.info("   - Invalid data API call simulation")
-                    Log.info("   - Error response expected")
-                    Log.info("   - Error handling validation")
-                    Log.info("   ✅ Invalid data error handling structure")
-                except Exception as e:
-                    Log.info(f"   ⚠️  Expected error simulation: {type(e).__name__}")
-                
-                # Test non-existent user
-                Log.info("2. Non-existent User Test")
-                non_existent_id = 99999
-                
-                try:
-                    # This would trigger a 404 error in real API
-                    # response = self.user_ops.get_user_by_id(non_existent_id)
-                    Log.info(f"   - Non-existent user ID {non_existent_id}")
-                    Log.info("   - 404 error expected")
-                    Log.info("   - Error response validation")
-                    Log.info("   ✅ Non-existent user error handling structure")
-                except Exception as e:
-                    Log.info(f"   ⚠️  Expected error simulation: {type(e).__name__}")
-                
-                # Test network errors
-                Log.info("3. Network Error Test")
-                Log.info("   - Network timeout simulation")
-                Log.info("   - Connection error handling")
-                Log.info("   - Retry mechanism validation")
-                Log.info("   ✅ Network error handling structure")
-                
-                Log.info("   🎉 API error handling test completed")
-                
-        except Exception as e:
-            Log.error(f"test_api_error_handling test failed: {str(e)}")
-            Log.end_test("test_api_error_handling", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_api_error_handling", "PASSED")
-    
-    @allure.story("API Response Validation")
-    @allure.severity(allure.severity_level.NORMAL)
-    def test_api_response_validation(self):
-        """Test API response validation"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_api_response_validation")
-        
-        try:
-            with allure.step("Test API response validation"):
-                Log.info("\n=== API Response Validation Test ===")
-                
-                # Test successful response validation
-                Log.info("1. Successful Response Validation")
-                Log.info("   - Status code 200 validation")
-                Log.info("   - Response body structure validation")
-                Log.info("   - Data type validation")
-                Log.info("   - Required fields validation")
-                Log.info("   ✅ Successful response validation structure")
-                
-                # Test error response validation
-                Log.info("2. Error Response Validation")
-                Log.info("   - Error status code validation")
-                Log.info("   - Error message validation")
-                Log.info("   - Error code validation")
-                Log.info("   - Error details validation")
-                Log.info("   ✅ Error response validation structure")
-                
-                # Test response time validation
-                Log.info("3. Response Time Validation")
-                timeout = TestEnvironment.get_timeout()
-                Log.info(f"   - Response time limit: {timeout} seconds")
-                Log.info("   - Performance validation")
-                Log.info("   - Timeout handling")
-                Log.info("   ✅ Response time validation structure")
-                
-                Log.info("   🎉 API response validation test completed")
-                
-        except Exception as e:
-            Log.error(f"test_api_response_validation test failed: {str(e)}")
-            Log.end_test("test_api_response_validation", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_api_response_validation", "PASSED")
+
+# api_client and user_ops come from the user conftest; payloads are read once here
+# (named apart from the conftest's session test_data, which is a UserTestData instance)
+@pytest.fixture(scope="module")
+def api_payloads():
+    """User payloads read once from UserTestData"""
+    return SimpleNamespace(
+        valid_user_1=UserTestData.VALID_USER_1,
+        update_name_only=UserTestData.UPDATE_NAME_ONLY,
+        invalid_user=UserTestData.INVALID_USER_NO_NAME
+    )
+
+
+# Narrative logged by each test as a single record;
+# %(name)s fields are filled by Log.info only when the record is written
+REAL_API_CONNECTION_LOG = "\n".join([
+    "\n=== Real API Connection Test ===",
+    "1. API Client Initialization",
+    "   ✅ API client initialized successfully",
+    "2. Host Configuration: %(host)s",
+    "   ✅ Host configuration correct",
+    "3. Headers Configuration: %(headers)s",
+    "   ✅ Headers configuration correct",
+    "4. Timeout Configuration: %(timeout)s seconds",
+    "   ✅ Timeout configuration correct",
+    "   🎉 Real API connection test completed"
+])
+
+USER_CREATION_API_LOG = "\n".join([
+    "\n=== User Creation API Test ===",
+    "1. Test Data Preparation",
+    "   User data: %(user_data)s",
+    "   ✅ Test data prepared",
+    "2. User Creation via API",
+    "   - API call would be made here",
+    "   - User creation request sent",
+    "   - Response validation performed",
+    "   ✅ User creation API test structure",
+    "3. Response Validation",
+    "   - Status code validation",
+    "   - Response body validation",
+    "   - Error handling validation",
+    "   ✅ Response validation structure",
+    "   🎉 User creation API test completed"
+])
+
+USER_RETRIEVAL_API_LOG = "\n".join([
+    "\n=== User Retrieval API Test ===",
+    "1. Get All Users API",
+    "   - API call would be made here",
+    "   - Users list request sent",
+    "   - Response processing performed",
+    "   ✅ Get all users API test structure",
+    "2. Get User by ID API",
+    "   - API call for user ID %(test_user_id)s",
+    "   - User details request sent",
+    "   - Response validation performed",
+    "   ✅ Get user by ID API test structure",
+    "   🎉 User retrieval API test completed"
+])
+
+USER_UPDATE_API_LOG = "\n".join([
+    "\n=== User Update API Test ===",
+    "1. Update Data Preparation",
+    "   Update data: %(update_data)s",
+    "   ✅ Update data prepared",
+    "2. User Update via API",
+    "   - API call for user ID %(test_user_id)s",
+    "   - User update request sent",
+    "   - Response validation performed",
+    "   ✅ User update API test structure",
+    "3. Update Response Validation",
+    "   - Status code validation",
+    "   - Updated data verification",
+    "   - Change confirmation",
+    "   ✅ Update response validation structure",
+    "   🎉 User update API test completed"
+])
+
+USER_DELETION_API_LOG = "\n".join([
+    "\n=== User Deletion API Test ===",
+    "1. User Deletion via API",
+    "   - API call for user ID %(test_user_id)s",
+    "   - User deletion request sent",
+    "   - Response validation performed",
+    "   ✅ User deletion API test structure",
+    "2. Deletion Response Validation",
+    "   - Status code validation",
+    "   - Deletion confirmation",
+    "   - User existence verification",
+    "   ✅ Deletion response validation structure",
+    "   🎉 User deletion API test completed"
+])
+
+API_ERROR_HANDLING_LOG = "\n".join([
+    "\n=== API Error Handling Test ===",
+    "1. Invalid User Data Test",
+    "   - Invalid data API call simulation",
+    "   - Error response expected",
+    "   - Error handling validation",
+    "   ✅ Invalid data error handling structure",
+    "2. Non-existent User Test",
+    "   - Non-existent user ID %(non_existent_id)s",
+    "   - 404 error expected",
+    "   - Error response validation",
+    "   ✅ Non-existent user error handling structure",
+    "3. Network Error Test",
+    "   - Network timeout simulation",
+    "   - Connection error handling",
+    "   - Retry mechanism validation",
+    "   ✅ Network error handling structure",
+    "   🎉 API error handling test completed"
+])
+
+API_RESPONSE_VALIDATION_LOG = "\n".join([
+    "\n=== API Response Validation Test ===",
+    "1. Successful Response Validation",
+    "   - Status code 200 validation",
+    "   - Response body structure validation",
+    "   - Data type validation",
+    "   - Required fields validation",
+    "   ✅ Successful response validation structure",
+    "2. Error Response Validation",
+    "   - Error status code validation",
+    "   - Error message validation",
+    "   - Error code validation",
+    "   - Error details validation",
+    "   ✅ Error response validation structure",
+    "3. Response Time Validation",
+    "   - Response time limit: %(timeout)s seconds",
+    "   - Performance validation",
+    "   - Timeout handling",
+    "   ✅ Response time validation structure",
+    "   🎉 API response validation test completed"
+])
+
+API_PERFORMANCE_LOG = "\n".join([
+    "\n=== API Performance Test ===",
+    "1. Response Time Test",
+    "   - Expected response time: < %(timeout)s seconds",
+    "   - Performance monitoring",
+    "   - Timeout handling",
+    "   ✅ Response time test structure",
+    "2. Concurrent Requests Test",
+    "   - Multiple simultaneous requests",
+    "   - Load testing simulation",
+    "   - Performance degradation monitoring",
+    "   ✅ Concurrent requests test structure",
+    "3. Data Volume Test",
+    "   - Large data set handling",
+    "   - Pagination performance",
+    "   - Memory usage monitoring",
+    "   ✅ Data volume test structure",
+    "   🎉 API performance test completed"
+])
+
+API_SECURITY_LOG = "\n".join([
+    "\n=== API Security Test ===",
+    "1. Input Validation",
+    "   - SQL injection prevention",
+    "   - XSS prevention",
+    "   - Input sanitization",
+    "   - Malicious input handling",
+    "   ✅ Input validation structure",
+    "2. Access Control",
+    "   - Role-based access",
+    "   - Permission validation",
+    "   - Resource protection",
+    "   - Unauthorized access prevention",
+    "   ✅ Access control structure",
+    "3. Data Protection",
+    "   - Sensitive data encryption",
+    "   - Data transmission security",
+    "   - Audit logging",
+    "   - Compliance validation",
+    "   ✅ Data protection structure",
+    "   🎉 API security test completed"
+])
+
+API_INTEGRATION_LOG = "\n".join([
+    "\n=== API Integration Test ===",
+    "1. Business Operations Integration",
+    "   - API client integration verified",
+    "   - Business logic integration",
+    "   - Data flow validation",
+    "   ✅ Business operations integration",
+    "2. Data Flow Test",
+    "   - Test data preparation",
+    "   - API request generation",
+    "   - Response processing",
+    "   - Data validation",
+    "   ✅ Data flow test structure",
+    "3. End-to-End Workflow Test",
+    "   - Complete user lifecycle",
+    "   - Create -> Read -> Update -> Delete",
+    "   - Workflow validation",
+    "   - Integration verification",
+    "   ✅ End-to-end workflow test structure",
+    "   🎉 API integration test completed"
+])
+
+
+# Scenario bodies run by test_api_scenario
+def _user_creation_api(user_ops, api_payloads, env_config):
+    """Test user creation via real API"""
+    user_data = api_payloads.valid_user_1
+    # This would be a real API call in actual implementation
+    # response = user_ops.create_user(user_data)
+    Log.info(USER_CREATION_API_LOG, {"user_data": user_data})
+
+
+def _user_retrieval_api(user_ops, api_payloads, env_config):
+    """Test user retrieval via real API"""
+    test_user_id = 1
+    # These would be real API calls
+    # response = user_ops.get_all_users()
+    # response = user_ops.get_user_by_id(test_user_id)
+    Log.info(USER_RETRIEVAL_API_LOG, {"test_user_id": test_user_id})
+
+
+def _user_update_api(user_ops, api_payloads, env_config):
+    """Test user update via real API"""
+    update_data = api_payloads.update_name_only
+    test_user_id = 1
+    # This would be a real API call
+    # response = user_ops.update_user(test_user_id, update_data)
+    Log.info(USER_UPDATE_API_LOG, {"update_data": update_data, "test_user_id": test_user_id})
+
+
+def _user_deletion_api(user_ops, api_payloads, env_config):
+    """Test user deletion via real API"""
+    test_user_id = 1
+    # This would be a real API call
+    # response = user_ops.delete_user(test_user_id)
+    Log.info(USER_DELETION_API_LOG, {"test_user_id": test_user_id})
+
+
+def _api_error_handling(user_ops, api_payloads, env_config):
+    """Test API error handling"""
+    non_existent_id = 99999
+    # This would trigger an error in real API
+    # response = user_ops.create_user(api_payloads.invalid_user)
+    # This would trigger a 404 error in real API
+    # response = user_ops.get_user_by_id(non_existent_id)
+    Log.info(API_ERROR_HANDLING_LOG, {"non_existent_id": non_existent_id})
+
+
+def _api_response_validation(user_ops, api_payloads, env_config):
+    """Test API response validation"""
+    timeout = env_config["timeout"]
+    Log.info(API_RESPONSE_VALIDATION_LOG, {"timeout": timeout})
+
+
+def _api_authentication(user_ops, api_payloads, env_config):
+    """Test API authentication"""
+    has_auth = 'Authorization' in env_config["headers"]
+    Log.info("API authentication: auth=%s (%s)", has_auth,
+             'Authorization header configured' if has_auth else 'public API configuration')
+
+
+def _api_performance(user_ops, api_payloads, env_config):
+    """Test API performance"""
+    timeout = env_config["timeout"]
+    Log.info(API_PERFORMANCE_LOG, {"timeout": timeout})
+
+
+def _api_security(user_ops, api_payloads, env_config):
+    """Test API security features"""
+    Log.info(API_SECURITY_LOG)
+
+
+SCENARIOS = [
+    ("user_creation_api", _user_creation_api),
+    ("user_retrieval_api", _user_retrieval_api),
+    ("user_update_api", _user_update_api),
+    ("user_deletion_api", _user_deletion_api),
+    ("api_error_handling", _api_error_handling),
+    ("api_response_validation", _api_response_validation),
+    ("api_authentication", _api_authentication),
+    ("api_performance", _api_performance),
+    ("api_security", _api_security),
+]
+
+# Allure story and severity per test, applied by the root conftest at collection
+CRITICAL = allure.severity_level.CRITICAL
+NORMAL = allure.severity_level.NORMAL
+
+ALLURE_STORIES = {
+    "test_real_api_connection": ("Real API Connection", CRITICAL),
+    "test_api_scenario[user_creation_api]": ("User Creation API", CRITICAL),
+    "test_api_scenario[user_retrieval_api]": ("User Retrieval API", NORMAL),
+    "test_api_scenario[user_update_api]": ("User Update API", NORMAL),
+    "test_api_scenario[user_deletion_api]": ("User Deletion API", CRITICAL),
+    "test_api_scenario[api_error_handling]": ("API Error Handling", NORMAL),
+    "test_api_scenario[api_response_validation]": ("API Response Validation", NORMAL),
+    "test_api_scenario[api_authentication]": ("API Authentication", CRITICAL),
+    "test_api_scenario[api_performance]": ("API Performance", NORMAL),
+    "test_api_scenario[api_security]": ("API Security", CRITICAL),
+    "test_api_integration": ("API Integration", CRITICAL),
+}
+
+
+def test_real_api_connection(api_client, env_config):
+    """Test real API connection"""
+    # Verify client, host and headers configuration in one batch
+    host = env_config["host"]
+    headers = env_config["headers"]
+    Checker.assert_all([
+        (Checker.assert_not_none, api_client, "api_client"),
+        (Checker.assert_not_none, host, "host"),
+        (Checker.assert_attr_equal, api_client, 'host', host),
+        (Checker.assert_not_none, headers, "headers")
+    ])
     
-    @allure.story("API Authentication")
-    @allure.severity(allure.severity_level.CRITICAL)
-    def test_api_authentication(self):
-        """Test API authentication"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_api_authentication")
-        
-        try:
-            with allure.step("Test API authentication"):
-                Log.info("\n=== API Authentication Test ===")
-                
-                # Test authentication headers
-                Log.info("1. Authentication Headers")
-                headers = TestEnvironment.get_headers()
-                
-                if 'Authorization' in headers:
-                    Log.info("   - Authorization header present")
-                    Log.info("   - Token validation")
-                    Log.info("   ✅ Authentication headers configured")
-                else:
-                    Log.info("   - No authentication required")
-                    Log.info("   ✅ Public API configuration")
-                
-                # Test authentication flow
-                Log.info("2. Authentication Flow")
-                Log.info("   - Token generation")
-                Log.info("   - Token validation")
-                Log.info("   - Token refresh")
-                Log.info("   - Session management")
-                Log.info("   ✅ Authentication flow structure")
-                
-                # Test unauthorized access
-                Log.info("3. Unauthorized Access Test")
-                Log.info("   - Invalid token test")
-                Log.info("   - Expired token test")
-                Log.info("   - Missing token test")
-                Log.info("   - 401 error handling")
-                Log.info("   ✅ Unauthorized access handling structure")
-                
-                Log.info("   🎉 API authentication test completed")
-                
-        except Exception as e:
-            Log.error(f"test_api_authentication test failed: {str(e)}")
-            Log.end_test("test_api_authentication", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_api_authentication", "PASSED")
+    # Check that API client headers contain the original headers plus logId
+    Checker.assert_contains(api_client.headers, 'logId')  # API client should have logId
+    # Remove logId for comparison with original headers
+    api_headers_without_logid = api_client.headers.copy()
+    api_headers_without_logid.pop('logId', None)
+    Checker.assert_dict_equal(api_headers_without_logid, headers)
     
-    @allure.story("API Performance")
-    @allure.severity(allure.severity_level.NORMAL)
-    def test_api_performance(self):
-        """Test API performance"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_api_performance")
-        
-        try:
-            with allure.step("Test API performance"):
-                Log.info("\n=== API Performance Test ===")
-                
-                # Test response time
-                Log.info("1. Response Time Test")
-                timeout = TestEnvironment.get_timeout()
-                Log.info(f"   - Expected response time: < {timeout} seconds")
-                Log.info("   - Performance monitoring")
-                Log.info("   - Timeout handling")
-                Log.info("   ✅ Response time test structure")
-                
-                # Test concurrent requests
-                Log.info("2. Concurrent Requests Test")
-                Log.info("   - Multiple simultaneous requests")
-                Log.info("   - Load testing simulation")
-                Log.info("   - Performance degradation monitoring")
-                Log.info("   ✅ Concurrent requests test structure")
-                
-                # Test data volume
-                Log.info("3. Data Volume Test")
-                Log.info("   - Large data set handling")
-                Log.info("   - Pagination performance")
-                Log.info("   - Memory usage monitoring")
-                Log.info("   ✅ Data volume test structure")
-                
-                Log.info("   🎉 API performance test completed")
-                
-        except Exception as e:
-            Log.error(f"test_api_performance test failed: {str(e)}")
-            Log.end_test("test_api_performance", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_api_performance", "PASSED")
+    # Test timeout configuration
+    timeout = env_config["timeout"]
+    assert timeout > 0, "timeout should be greater than 0"
     
-    @allure.story("API Integration")
-    @allure.severity(allure.severity_level.CRITICAL)
-    def test_api_integration(self):
-        """Test API integration with business logic"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_api_integration")
-        
-        try:
-            with allure.step("Test API integration with business logic"):
-                Log.info("\n=== API Integration Test ===")
-                
-                # Test business operations integration
-                Log.info("1. Business Operations Integration")
-                Checker.assert_has_attr(self.user_ops, 'base_url')
-                Checker.assert_has_attr(self.user_ops, 'headers')
-                Log.info("   - API client integration verified")
-                Log.info("   - Business logic integration")
-                Log.info("   - Data flow validation")
-                Log.info("   ✅ Business operations integration")
-                
-                # Test data flow
-                Log.info("2. Data Flow Test")
-                Log.info("   - Test data preparation")
-                Log.info("   - API request generation")
-                Log.info("   - Response processing")
-                Log.info("   - Data validation")
-                Log.info("   ✅ Data flow test structure")
-                
-                # Test end-to-end workflow
-                Log.info("3. End-to-End Workflow Test")
-                Log.info("   - Complete user lifecycle")
-                Log.info("   - Create -> Read -> Update -> Delete")
-                Log.info("   - Workflow validation")
-                Log.info("   - Integration verification")
-                Log.info("   ✅ End-to-end workflow test structure")
-                
-                Log.info("   🎉 API integration test completed")
-                
-        except Exception as e:
-            Log.error(f"test_api_integration test failed: {str(e)}")
-            Log.end_test("test_api_integration", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_api_integration", "PASSED")
+    Log.info(REAL_API_CONNECTION_LOG, {"host": host, "headers": headers, "timeout": timeout})
+
+
+@pytest.mark.parametrize(
+    "body",
+    [scenario[1] for scenario in SCENARIOS],
+    ids=[scenario[0] for scenario in SCENARIOS]
+)
+def test_api_scenario(user_ops, api_payloads, env_config, body):
+    """Test a real API scenario whose body only logs its checks"""
+    body(user_ops, api_payloads, env_config)
+
+
+def test_api_integration(user_ops):
+    """Test API integration with business logic"""
+    # Test business operations integration
+    Checker.assert_all([
+        (Checker.assert_has_attr, user_ops, 'base_url'),
+        (Checker.assert_has_attr, user_ops, 'headers')
+    ])
     
-    @allure.story("API Security")
-    @allure.severity(allure.severity_level.CRITICAL)
-    def test_api_security(self):
-        """Test API security features"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_api_security")
-        
-        try:
-            with allure.step("Test API security features"):
-                Log.info("\n=== API Security Test ===")
-                
-                # Test input validation
-                Log.info("1. Input Validation")
-                Log.info("   - SQL injection prevention")
-                Log.info("   - XSS prevention")
-                Log.info("   - Input sanitization")
-                Log.info("   - Malicious input handling")
-                Log.info("   ✅ Input validation structure")
-                
-                # Test access control
-                Log.info("2. Access Control")
-                Log.info("   - Role-based access")
-                Log.info("   - Permission validation")
-                Log.info("   - Resource protection")
-                Log.info("   - Unauthorized access prevention")
-                Log.info("   ✅ Access control structure")
-                
-                # Test data protection
-                Log.info("3. Data Protection")
-                Log.info("   - Sensitive data encryption")
-                Log.info("   - Data transmission security")
-                Log.info("   - Audit logging")
-                Log.info("   - Compliance validation")
-                Log.info("   ✅ Data protection structure")
-                
-                Log.info("   🎉 API security test completed")
-                
-        except Exception as e:
-            Log.error(f"test_api_security test failed: {str(e)}")
-            Log.end_test("test_api_security", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_api_security", "PASSED")
+    Log.info(API_INTEGRATION_LOG)
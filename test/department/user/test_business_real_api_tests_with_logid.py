@@ -3,15 +3,49 @@ PTE Business Real API Tests with Static Log
 Real API integration tests for user business operations with enhanced logging
 """
 import pytest
-import allure
-import os
-from config.settings import TestEnvironment
+from core.allure_compat import allure, step
 from api.client import APIClient
-from biz.department.user.operations import UserOperations
 from data.department.user.test_data import UserTestData
-from core.checker import Checker
-from biz.department.user.checker import UserErrorChecker
-from core.logger import Log, generate_logid
+from core.logger import Log
+
+
+# Test payloads read once at import
+VALID_USER_1 = UserTestData.VALID_USER_1
+UPDATE_NAME_ONLY = UserTestData.UPDATE_NAME_ONLY
+
+# CRUD API calls checked by test_crud_api_with_static_log:
+# (method, path, status_code, response_time, request_data, response_data)
+API_CASES = [
+    pytest.param("POST", "/api/users", 201, 0.5,
+                 {"user_data": VALID_USER_1}, {"status": "created"},
+                 id="create_user"),
+    pytest.param("GET", "/api/users", 200, 0.3,
+                 {}, {"users": [], "count": 0},
+                 id="get_all_users"),
+    pytest.param("GET", "/api/users/1", 200, 0.2,
+                 {"user_id": 1}, {"user": {"id": 1}},
+                 id="get_user_by_id"),
+    pytest.param("PUT", "/api/users/1", 200, 0.4,
+                 {"user_id": 1, "update_data": UPDATE_NAME_ONLY}, {"status": "updated"},
+                 id="update_user"),
+    pytest.param("DELETE", "/api/users/1", 204, 0.3,
+                 {"user_id": 1}, {"status": "deleted"},
+                 id="delete_user"),
+]
+
+# Allure story and severity per test, applied by the root conftest at collection
+CRITICAL = allure.severity_level.CRITICAL
+NORMAL = allure.severity_level.NORMAL
+
+ALLURE_STORIES = {
+    "test_real_api_connection_with_static_log": ("Real API Connection with Static Log", CRITICAL),
+    "test_crud_api_with_static_log[create_user]": ("User Creation API with Static Log", CRITICAL),
+    "test_crud_api_with_static_log[get_all_users]": ("User Retrieval API with Static Log", NORMAL),
+    "test_crud_api_with_static_log[get_user_by_id]": ("User Retrieval API with Static Log", NORMAL),
+    "test_crud_api_with_static_log[update_user]": ("User Update API with Static Log", NORMAL),
+    "test_crud_api_with_static_log[delete_user]": ("User Deletion API with Static Log", NORMAL),
+    "test_end_to_end_workflow_with_static_log": ("End-to-End Workflow with Static Log", CRITICAL),
+}
 
 
 @allure.epic("PTE Framework")
@@ -19,35 +53,26 @@ from core.logger import Log, generate_logid
 class TestBusinessRealAPIWithStaticLog:
     """PTE Business Real API Tests with static log support"""
     
+    @pytest.fixture(scope="class", autouse=True)
+    def _class_setup(self, request):
+        """Build components once for the class (environment is set in conftest)"""
+        request.cls.api_client = APIClient()
+    
     @pytest.fixture(autouse=True)
-    def setup(self):
-        """Setup test environment with static log"""
-        # Setup environment
-        os.environ['TEST_IDC'] = 'local_test'
-        os.environ['TEST_ENV'] = 'local'
-        
-        # Initialize components (no need to pass logid)
-        self.api_client = APIClient()
-        self.user_ops = UserOperations()
-        self.test_data = UserTestData()     
-        Log.info("Test environment setup completed", {
-            "environment": TestEnvironment.get_current_env(),
-            "host": TestEnvironment.get_host()
+    def _per_test(self, env_config):
+        """Per-test setup: only log the environment under the test's logid"""
+        Log.info("Test environment setup completed", data=lambda: {
+            "environment": env_config["env"],
+            "host": env_config["host"]
         })
     
-    @allure.story("Real API Connection with Static Log")
-    @allure.severity(allure.severity_level.CRITICAL)
-    def test_real_api_connection_with_static_log(self):
-        """Test real API connection with static log tracing"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_real_api_connection_with_static_log")
+    def test_real_api_connection_with_static_log(self, env_config, auto_logid):
+        """Test real API connection with static log tracing (LogID is set by auto_logid)"""
+        logid = auto_logid
         
-        try:
-            with allure.step("Verify real API connection with static log"):
+        # Run the test body with start/end logging
+        with Log.test("test_real_api_connection_with_static_log"):
+            with step("Verify real API connection with static log"):
                 Log.info("Starting real API connection test with static log")
                 
                 # Test API client initialization
@@ -55,19 +80,19 @@ class TestBusinessRealAPIWithStaticLog:
                     "API client initialization",
                     self.api_client is not None,
                     expected="Not None",
-                    actual=type(self.api_client).__name__
+                    actual=lambda: type(self.api_client).__name__
                 )
                 
                 # Test logid in API client
                 Log.assertion(
                     "API client logid validation",
-                    self.api_client.logid == Log.get_logid(),
-                    expected=Log.get_logid(),
+                    self.api_client.logid == logid,
+                    expected=logid,
                     actual=self.api_client.logid
                 )
                 
                 # Test host configuration
-                host = TestEnvironment.get_host()
+                host = env_config["host"]
                 Log.assertion(
                     "Host configuration validation",
                     host is not None and self.api_client.host == host,
@@ -77,15 +102,16 @@ class TestBusinessRealAPIWithStaticLog:
                 
                 # Test headers configuration with logid
                 headers = self.api_client.get_environment_info()
+                header_logid = self.api_client.headers.get('logId')
                 Log.assertion(
                     "Headers configuration with logid validation",
-                    'logId' in self.api_client.headers and self.api_client.headers['logId'] == Log.get_logid(),
-                    expected=Log.get_logid(),
-                    actual=self.api_client.headers.get('logId')
+                    header_logid == logid,
+                    expected=logid,
+                    actual=header_logid
                 )
                 
                 # Test timeout configuration
-                timeout = TestEnvironment.get_timeout()
+                timeout = env_config["timeout"]
                 Log.assertion(
                     "Timeout configuration validation",
                     timeout > 0,
@@ -94,288 +120,69 @@ class TestBusinessRealAPIWithStaticLog:
                 )
                 
                 Log.info("Real API connection test completed successfully")
-                
-        except Exception as e:
-            Log.error(f"Real API connection test failed: {str(e)}")
-            Log.end_test("test_real_api_connection_with_static_log", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_real_api_connection_with_static_log", "PASSED")
     
-    @allure.story("User Creation API with Static Log")
-    @allure.severity(allure.severity_level.CRITICAL)
-    def test_user_creation_api_with_static_log(self):
-        """Test user creation via real API with static log tracing"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
+    @pytest.mark.parametrize(
+        "method,path,status_code,response_time,request_data,response_data",
+        API_CASES
+    )
+    def test_crud_api_with_static_log(self, request, method, path, status_code, response_time,
+                                      request_data, response_data):
+        """Test one user CRUD API call via real API with static log tracing"""
+        test_name = request.node.name
         
-        # Step 2: Start test
-        Log.start_test("test_user_creation_api_with_static_log")
-        
-        try:
-            with allure.step("Test user creation via real API with static log"):
-                Log.info("Starting user creation API test with static log")
-                
-                # Get test data
-                user_data = self.test_data.VALID_USER_1
-                Log.info("Test data prepared", {
-                    "user_data": user_data
-                })
-                
-                # Test user creation with static log
-                with allure.step("Execute user creation API call with static log"):
-                    Log.info("Executing user creation API call with static log")
-                    try:
-                        # This would be a real API call in actual implementation
-                        # response = self.user_ops.create_user(user_data)
-                        Log.api_call(
-                            "POST", 
-                            "/api/users", 
-                            status_code=201, 
-                            response_time=0.5,
-                            request_data={"user_data": user_data},
-                            response_data={"status": "created"}
-                        )
-                        Log.info("User creation API call structure validated with static log")
-                    except Exception as e:
-                        Log.warning(f"API call simulation: {type(e).__name__}")
-                
-                # Validate response structure
-                with allure.step("Validate response structure with static log"):
-                    Log.info("Validating response structure with static log")
-                    Log.assertion("Status code validation", True)
-                    Log.assertion("Response body validation", True)
-                    Log.assertion("User data verification", True)
-                    Log.assertion("LogID in response validation", True)
-                
-                Log.info("User creation API test completed successfully")
-                
-        except Exception as e:
-            Log.error(f"User creation API test failed: {str(e)}")
-            Log.end_test("test_user_creation_api_with_static_log", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_user_creation_api_with_static_log", "PASSED")
+        # Run the test body with start/end logging (LogID is set by auto_logid)
+        with Log.test(test_name):
+            with step(f"Test {method} {path} via real API with static log"):
+                Log.info(f"Starting {method} {path} API test with static log")
+                
+                # Test the API call with static log
+                with step(f"Execute {method} {path} API call with static log"):
+                    Log.info(f"Executing {method} {path} API call with static log")
+                    # This would be a real API call in actual implementation
+                    Log.api_call(
+                        method,
+                        path,
+                        status_code=status_code,
+                        response_time=response_time,
+                        request_data=request_data,
+                        response_data=response_data
+                    )
+                
+                Log.info(f"{method} {path} API test completed successfully")
     
-    @allure.story("User Retrieval API with Static Log")
-    @allure.severity(allure.severity_level.NORMAL)
-    def test_user_retrieval_api_with_static_log(self):
-        """Test user retrieval via real API with static log tracing"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_user_retrieval_api_with_static_log")
-        
-        try:
-            with allure.step("Test user retrieval via real API with static log"):
-                Log.info("Starting user retrieval API test with static log")
-                
-                # Test get all users with static log
-                with allure.step("Get all users API with static log"):
-                    Log.info("Testing get all users API with static log")
-                    try:
-                        # response = self.user_ops.get_all_users()
-                        Log.api_call(
-                            "GET", 
-                            "/api/users", 
-                            status_code=200, 
-                            response_time=0.3,
-                            request_data={},
-                            response_data={"users": [], "count": 0}
-                        )
-                        Log.info("Get all users API structure validated with static log")
-                    except Exception as e:
-                        Log.warning(f"API call simulation: {type(e).__name__}")
-                
-                # Test get user by ID with static log
-                with allure.step("Get user by ID API with static log"):
-                    test_user_id = 1
-                    Log.info(f"Testing get user by ID API for user ID: {test_user_id}")
-                    try:
-                        # response = self.user_ops.get_user_by_id(test_user_id)
-                        Log.api_call(
-                            "GET", 
-                            f"/api/users/{test_user_id}", 
-                            status_code=200, 
-                            response_time=0.2,
-                            request_data={"user_id": test_user_id},
-                            response_data={"user": {"id": test_user_id}}
-                        )
-                        Log.info("Get user by ID API structure validated with static log")
-                    except Exception as e:
-                        Log.warning(f"API call simulation: {type(e).__name__}")
-                
-                Log.info("User retrieval API test completed successfully")
-                
-        except Exception as e:
-            Log.error(f"User retrieval API test failed: {str(e)}")
-            Log.end_test("test_user_retrieval_api_with_static_log", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_user_retrieval_api_with_static_log", "PASSED")
-    
-    @allure.story("User Update API with Static Log")
-    @allure.severity(allure.severity_level.NORMAL)
-    def test_user_update_api_with_static_log(self):
-        """Test user update via real API with static log tracing"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_user_update_api_with_static_log")
-        
-        try:
-            with allure.step("Test user update via real API with static log"):
-                Log.info("Starting user update API test with static log")
-                
-                # Prepare update data
-                test_user_id = 1
-                update_data = self.test_data.UPDATE_NAME_ONLY
-                Log.info("Update data prepared", {
-                    "update_data": update_data
-                })
-                
-                # Test user update with static log
-                with allure.step("Execute user update API call with static log"):
-                    Log.info(f"Executing user update API call for user ID: {test_user_id}")
-                    try:
-                        # response = self.user_ops.update_user(test_user_id, update_data)
-                        Log.api_call(
-                            "PUT", 
-                            f"/api/users/{test_user_id}", 
-                            status_code=200, 
-                            response_time=0.4,
-                            request_data={"user_id": test_user_id, "update_data": update_data},
-                            response_data={"status": "updated"}
-                        )
-                        Log.info("User update API call structure validated with static log")
-                    except Exception as e:
-                        Log.warning(f"API call simulation: {type(e).__name__}")
-                
-                # Validate update response
-                with allure.step("Validate update response with static log"):
-                    Log.info("Validating update response with static log")
-                    Log.assertion("Status code validation", True)
-                    Log.assertion("Updated data verification", True)
-                    Log.assertion("Change confirmation", True)
-                    Log.assertion("LogID in response validation", True)
-                
-                Log.info("User update API test completed successfully")
-                
-        except Exception as e:
-            Log.error(f"User update API test failed: {str(e)}")
-            Log.end_test("test_user_update_api_with_static_log", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_user_update_api_with_static_log", "PASSED")
-    
-    @allure.story("User Deletion API with Static Log")
-    @allure.severity(allure.severity_level.NORMAL)
-    def test_user_deletion_api_with_static_log(self):
-        """Test user deletion via real API with static log tracing"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_user_deletion_api_with_static_log")
-        
-        try:
-            with allure.step("Test user deletion via real API with static log"):
-                Log.info("Starting user deletion API test with static log")
-                
-                # Test user deletion with static log
-                test_user_id = 1
-                with allure.step("Execute user deletion API call with static log"):
-                    Log.info(f"Executing user deletion API call for user ID: {test_user_id}")
-                    try:
-                        # response = self.user_ops.delete_user(test_user_id)
-                        Log.api_call(
-                            "DELETE", 
-                            f"/api/users/{test_user_id}", 
-                            status_code=204, 
-                            response_time=0.3,
-                            request_data={"user_id": test_user_id},
-                            response_data={"status": "deleted"}
-                        )
-                        Log.info("User deletion API call structure validated with static log")
-                    except Exception as e:
-                        Log.warning(f"API call simulation: {type(e).__name__}")
-                
-                # Validate deletion response
-                with allure.step("Validate deletion response with static log"):
-                    Log.info("Validating deletion response with static log")
-                    Log.assertion("Status code validation", True)
-                    Log.assertion("Deletion confirmation", True)
-                    Log.assertion("User existence verification", True)
-                    Log.assertion("LogID in response validation", True)
-                
-                Log.info("User deletion API test completed successfully")
-                
-        except Exception as e:
-            Log.error(f"User deletion API test failed: {str(e)}")
-            Log.end_test("test_user_deletion_api_with_static_log", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_user_deletion_api_with_static_log", "PASSED")
-    
-    @allure.story("End-to-End Workflow with Static Log")
-    @allure.severity(allure.severity_level.CRITICAL)
     def test_end_to_end_workflow_with_static_log(self):
         """Test complete user lifecycle with static log tracing"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_end_to_end_workflow_with_static_log")
-        
-        try:
-            with allure.step("Test complete user lifecycle with static log"):
+        # Run the test body with start/end logging (LogID is set by auto_logid)
+        with Log.test("test_end_to_end_workflow_with_static_log"):
+            with step("Test complete user lifecycle with static log"):
                 Log.info("Starting end-to-end workflow test with static log")
                 
                 # Step 1: Create user
-                with allure.step("Create user with static log"):
-                    user_data = self.test_data.VALID_USER_1
-                    Log.info("Creating user", {"user_data": user_data})
+                with step("Create user with static log"):
+                    user_data = VALID_USER_1
+                    Log.info("Creating user", data=lambda: {"user_data": user_data})
                     # response = self.user_ops.create_user(user_data)
                     Log.api_call("POST", "/api/users", status_code=201, response_time=0.5)
                 
                 # Step 2: Get user
-                with allure.step("Get user with static log"):
+                with step("Get user with static log"):
                     test_user_id = 1
-                    Log.info("Getting user", {"user_id": test_user_id})
+                    user_path = f"/api/users/{test_user_id}"
+                    Log.info("Getting user", data=lambda: {"user_id": test_user_id})
                     # response = self.user_ops.get_user_by_id(test_user_id)
-                    Log.api_call("GET", f"/api/users/{test_user_id}", status_code=200, response_time=0.2)
+                    Log.api_call("GET", user_path, status_code=200, response_time=0.2)
                 
                 # Step 3: Update user
-                with allure.step("Update user with static log"):
-                    update_data = self.test_data.UPDATE_NAME_ONLY
-                    Log.info("Updating user", {"user_id": test_user_id, "update_data": update_data})
+                with step("Update user with static log"):
+                    update_data = UPDATE_NAME_ONLY
+                    Log.info("Updating user", data=lambda: {"user_id": test_user_id, "update_data": update_data})
                     # response = self.user_ops.update_user(test_user_id, update_data)
-                    Log.api_call("PUT", f"/api/users/{test_user_id}", status_code=200, response_time=0.4)
+                    Log.api_call("PUT", user_path, status_code=200, response_time=0.4)
                 
                 # Step 4: Delete user
-                with allure.step("Delete user with static log"):
-                    Log.info("Deleting user", {"user_id": test_user_id})
+                with step("Delete user with static log"):
+                    Log.info("Deleting user", data=lambda: {"user_id": test_user_id})
                     # response = self.user_ops.delete_user(test_user_id)
-                    Log.api_call("DELETE", f"/api/users/{test_user_id}", status_code=204, response_time=0.3)
+                    Log.api_call("DELETE", user_path, status_code=204, response_time=0.3)
                 
                 Log.info("End-to-end workflow test completed successfully")
-                
-        except Exception as e:
-            Log.error(f"End-to-end workflow test failed: {str(e)}")
-            Log.end_test("test_end_to_end_workflow_with_static_log", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_end_to_end_workflow_with_static_log", "PASSED")
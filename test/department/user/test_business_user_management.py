@@ -1,546 +1,325 @@
-from core.logger import Log, generate_logid
 """
 PTE Business User Management Tests
 Business logic tests for user management operations
 """
 import pytest
-import allure
-import os
-from config.settings import TestEnvironment
-from api.client import APIClient
-from biz.department.user.operations import UserOperations
-from data.department.user.test_data import UserTestData
+from core.allure_compat import allure
 from core.checker import Checker
-from biz.department.user.checker import UserErrorChecker
+from core.logger import Log
+from data.department.user.test_data import UserTestData
 
+pytestmark = [
+    pytest.mark.smoke,
+    pytest.mark.parallel,
+    pytest.mark.usefixtures("log_lifecycle"),
+    allure.epic("PTE Framework"),
+    allure.feature("Business User Management")
+]
 
-@allure.epic("PTE Framework")
-@allure.feature("Business User Management")
-class TestBusinessUserManagement:
-    """PTE Business User Management Tests"""
-    
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        """Setup test environment"""
-        os.environ['TEST_IDC'] = 'local_test'
-        os.environ['TEST_ENV'] = 'local'
-        
-        # Initialize components
-        self.api_client = APIClient()
-        self.user_ops = UserOperations()
-        self.test_data = UserTestData()
-        self.user_checker = UserErrorChecker()
-    
-    @allure.story("User Creation Business Logic")
-    @allure.severity(allure.severity_level.CRITICAL)
-    def test_user_creation_business_logic(self):
-        """Test user creation business logic"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_user_creation_business_logic")
-        
-        try:
-            with allure.step("Test user creation business logic"):
-                Log.info("\n=== User Creation Business Logic Test ===")
-                
-                # Get valid user data
-                user_data = self.test_data.VALID_USER_1  # Use static property
-                
-                Log.info("1. Valid User Data Test")
-                Log.info(f"   User data: {user_data}")
-                
-                # Validate user data structure
-                Checker.assert_field_exists(user_data, 'name')
-                Checker.assert_field_exists(user_data, 'email')
-                Checker.assert_field_exists(user_data, 'age')
-                Checker.assert_field_value(user_data, 'name', "John Smith")
-                Checker.assert_field_value(user_data, 'email', "john.smith@example.com")
-                Checker.assert_field_value(user_data, 'age', 25)
-                Log.info("   ✅ Valid user data structure")
-                
-                # Test business validation
-                Log.info("2. Business Validation Test")
-                Log.info("   - Name validation")
-                Log.info("   - Email format validation")
-                Log.info("   - Age range validation")
-                Log.info("   - Duplicate email check")
-                Log.info("   ✅ Business validation structure")
-                
-                # Test user creation workflow
-                Log.info("3. User Creation Workflow")
-                Log.info("   - Data preparation")
-                Log.info("   - Business rule validation")
-                Log.info("   - User creation execution")
-                Log.info("   - Result validation")
-                Log.info("   ✅ User creation workflow")
-                
-                Log.info("   🎉 User creation business logic test completed")
-                
-        except Exception as e:
-            Log.error(f"test_user_creation_business_logic test failed: {str(e)}")
-            Log.end_test("test_user_creation_business_logic", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_user_creation_business_logic", "PASSED")
-    
-    @allure.story("User Retrieval Business Logic")
-    @allure.severity(allure.severity_level.NORMAL)
-    def test_user_retrieval_business_logic(self):
-        """Test user retrieval business logic"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_user_retrieval_business_logic")
-        
-        try:
-            with allure.step("Test user retrieval business logic"):
-                Log.info("\n=== User Retrieval Business Logic Test ===")
-                
-                # Test get all users business logic
-                Log.info("1. Get All Users Business Logic")
-                Log.info("   - Pagination handling")
-                Log.info("   - Filtering logic")
-                Log.info("   - Sorting logic")
-                Log.info("   - Data transformation")
-                Log.info("   ✅ Get all users business logic")
-                
-                # Test get user by ID business logic
-                Log.info("2. Get User by ID Business Logic")
-                Log.info("   - ID validation")
-                Log.info("   - User existence check")
-                Log.info("   - Data access control")
-                Log.info("   - Error handling")
-                Log.info("   ✅ Get user by ID business logic")
-                
-                # Test search users business logic
-                Log.info("3. Search Users Business Logic")
-                Log.info("   - Search criteria validation")
-                Log.info("   - Fuzzy search logic")
-                Log.info("   - Result ranking")
-                Log.info("   - Performance optimization")
-                Log.info("   ✅ Search users business logic")
-                
-                Log.info("   🎉 User retrieval business logic test completed")
-                
-        except Exception as e:
-            Log.error(f"test_user_retrieval_business_logic test failed: {str(e)}")
-            Log.end_test("test_user_retrieval_business_logic", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_user_retrieval_business_logic", "PASSED")
-    
-    @allure.story("User Update Business Logic")
-    @allure.severity(allure.severity_level.NORMAL)
-    def test_user_update_business_logic(self):
-        """Test user update business logic"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_user_update_business_logic")
-        
-        try:
-            with allure.step("Test user update business logic"):
-                Log.info("\n=== User Update Business Logic Test ===")
-                
-                # Get update test data
-                update_data = self.test_data.UPDATE_NAME_ONLY  # Use static property
-                
-                Log.info("1. Update Data Validation")
-                Log.info(f"   Update data: {update_data}")
-                
-                # Validate update data
-                Checker.assert_field_exists(update_data, 'name')
-                Checker.assert_field_value(update_data, 'name', "Updated John Smith")
-                Log.info("   ✅ Update data validation")
-                
-                # Test update business rules
-                Log.info("2. Update Business Rules")
-                Log.info("   - User existence validation")
-                Log.info("   - Field update permissions")
-                Log.info("   - Data integrity checks")
-                Log.info("   - Audit trail creation")
-                Log.info("   ✅ Update business rules")
-                
-                # Test partial update logic
-                Log.info("3. Partial Update Logic")
-                Log.info("   - Selective field updates")
-                Log.info("   - Unchanged field preservation")
-                Log.info("   - Validation of updated fields")
-                Log.info("   - Update timestamp handling")
-                Log.info("   ✅ Partial update logic")
-                
-                Log.info("   🎉 User update business logic test completed")
-                
-        except Exception as e:
-            Log.error(f"test_user_update_business_logic test failed: {str(e)}")
-            Log.end_test("test_user_update_business_logic", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_user_update_business_logic", "PASSED")
-    
-    @allure.story("User Deletion Business Logic")
-    @allure.severity(allure.severity_level.CRITICAL)
-    def test_user_deletion_business_logic(self):
-        """Test user deletion business logic"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_user_deletion_business_logic")
-        
-        try:
-            with allure.step("Test user deletion business logic"):
-                Log.info("\n=== User Deletion Business Logic Test ===")
-                
-                # Test deletion business rules
-                Log.info("1. Deletion Business Rules")
-                Log.info("   - User existence validation")
-                Log.info("   - Dependency checks")
-                Log.info("   - Permission validation")
-                Log.info("   - Cascade deletion logic")
-                Log.info("   ✅ Deletion business rules")
-                
-                # Test soft delete logic
-                Log.info("2. Soft Delete Logic")
-                Log.info("   - Mark as deleted")
-                Log.info("   - Data preservation")
-                Log.info("   - Recovery mechanism")
-                Log.info("   - Audit trail")
-                Log.info("   ✅ Soft delete logic")
-                
-                # Test hard delete logic
-                Log.info("3. Hard Delete Logic")
-                Log.info("   - Permanent data removal")
-                Log.info("   - Database cleanup")
-                Log.info("   - Resource deallocation")
-                Log.info("   - Final validation")
-                Log.info("   ✅ Hard delete logic")
-                
-                Log.info("   🎉 User deletion business logic test completed")
-                
-        except Exception as e:
-            Log.error(f"test_user_deletion_business_logic test failed: {str(e)}")
-            Log.end_test("test_user_deletion_business_logic", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_user_deletion_business_logic", "PASSED")
-    
-    @allure.story("User Validation Business Logic")
-    @allure.severity(allure.severity_level.NORMAL)
-    def test_user_validation_business_logic(self):
-        """Test user validation business logic"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_user_validation_business_logic")
-        
-        try:
-            with allure.step("Test user validation business logic"):
-                Log.info("\n=== User Validation Business Logic Test ===")
-                
-                # Test valid user data
-                valid_user = self.test_data.VALID_USER_1  # Use static property
-                Log.info("1. Valid User Validation")
-                Log.info(f"   Valid user: {valid_user}")
-                
-                # Validate business rules for valid user
-                Checker.assert_field_value(valid_user, 'name', "John Smith")
-                Checker.assert_field_value(valid_user, 'email', "john.smith@example.com")
-                Checker.assert_field_value(valid_user, 'age', 25)
-                Log.info("   ✅ Valid user business rules")
-                
-                # Test invalid user data
-                invalid_user = self.test_data.INVALID_USER_NO_NAME  # Use static property
-                Log.info("2. Invalid User Validation")
-                Log.info(f"   Invalid user: {invalid_user}")
-                
-                # Validate business rules for invalid user
-                Checker.assert_field_not_exists(invalid_user, 'name')
-                Checker.assert_field_exists(invalid_user, 'email')
-                Log.info("   ✅ Invalid user business rules")
-                
-                # Test business validation methods
-                Log.info("3. Business Validation Methods")
-                Log.info("   - Required field validation")
-                Log.info("   - Data format validation")
-                Log.info("   - Business rule validation")
-                Log.info("   - Cross-field validation")
-                Log.info("   ✅ Business validation methods")
-                
-                Log.info("   🎉 User validation business logic test completed")
-                
-        except Exception as e:
-            Log.error(f"test_user_validation_business_logic test failed: {str(e)}")
-            Log.end_test("test_user_validation_business_logic", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_user_validation_business_logic", "PASSED")
-    
-    @allure.story("User Error Handling Business Logic")
-    @allure.severity(allure.severity_level.NORMAL)
-    def test_user_error_handling_business_logic(self):
-        """Test user error handling business logic"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_user_error_handling_business_logic")
-        
-        try:
-            with allure.step("Test user error handling business logic"):
-                Log.info("\n=== User Error Handling Business Logic Test ===")
-                
-                # Test business error scenarios
-                Log.info("1. Business Error Scenarios")
-                Log.info("   - Duplicate email handling")
-                Log.info("   - Invalid data format handling")
-                Log.info("   - Missing required fields handling")
-                Log.info("   - Business rule violation handling")
-                Log.info("   ✅ Business error scenarios")
-                
-                # Test error response structure
-                Log.info("2. Error Response Structure")
-                Log.info("   - Error code generation")
-                Log.info("   - Error message formatting")
-                Log.info("   - Error details inclusion")
-                Log.info("   - Error logging")
-                Log.info("   ✅ Error response structure")
-                
-                # Test error recovery logic
-                Log.info("3. Error Recovery Logic")
-                Log.info("   - Transaction rollback")
-                Log.info("   - Data state restoration")
-                Log.info("   - Error notification")
-                Log.info("   - Recovery procedures")
-                Log.info("   ✅ Error recovery logic")
-                
-                Log.info("   🎉 User error handling business logic test completed")
-                
-        except Exception as e:
-            Log.error(f"test_user_error_handling_business_logic test failed: {str(e)}")
-            Log.end_test("test_user_error_handling_business_logic", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_user_error_handling_business_logic", "PASSED")
-    
-    @allure.story("User Business Rules")
-    @allure.severity(allure.severity_level.CRITICAL)
-    def test_user_business_rules(self):
-        """Test user business rules"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_user_business_rules")
-        
-        try:
-            with allure.step("Test user business rules"):
-                Log.info("\n=== User Business Rules Test ===")
-                
-                # Test user creation rules
-                Log.info("1. User Creation Rules")
-                Log.info("   - Name must be provided")
-                Log.info("   - Email must be unique")
-                Log.info("   - Age must be positive")
-                Log.info("   - Email format validation")
-                Log.info("   ✅ User creation rules")
-                
-                # Test user update rules
-                Log.info("2. User Update Rules")
-                Log.info("   - User must exist")
-                Log.info("   - Email uniqueness on update")
-                Log.info("   - Age range validation")
-                Log.info("   - Update permission check")
-                Log.info("   ✅ User update rules")
-                
-                # Test user deletion rules
-                Log.info("3. User Deletion Rules")
-                Log.info("   - User must exist")
-                Log.info("   - No active dependencies")
-                Log.info("   - Deletion permission check")
-                Log.info("   - Confirmation required")
-                Log.info("   ✅ User deletion rules")
-                
-                # Test user access rules
-                Log.info("4. User Access Rules")
-                Log.info("   - Authentication required")
-                Log.info("   - Authorization check")
-                Log.info("   - Data access control")
-                Log.info("   - Audit logging")
-                Log.info("   ✅ User access rules")
-                
-                Log.info("   🎉 User business rules test completed")
-                
-        except Exception as e:
-            Log.error(f"test_user_business_rules test failed: {str(e)}")
-            Log.end_test("test_user_business_rules", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_user_business_rules", "PASSED")
-    
-    @allure.story("User Data Transformation")
-    @allure.severity(allure.severity_level.NORMAL)
-    def test_user_data_transformation(self):
-        """Test user data transformation business logic"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_user_data_transformation")
-        
-        try:
-            with allure.step("Test user data transformation business logic"):
-                Log.info("\n=== User Data Transformation Test ===")
-                
-                # Test data formatting
-                Log.info("1. Data Formatting")
-                Log.info("   - Name capitalization")
-                Log.info("   - Email normalization")
-                Log.info("   - Age validation")
-                Log.info("   - Date formatting")
-                Log.info("   ✅ Data formatting")
-                
-                # Test data enrichment
-                Log.info("2. Data Enrichment")
-                Log.info("   - Timestamp addition")
-                Log.info("   - User ID generation")
-                Log.info("   - Status assignment")
-                Log.info("   - Metadata addition")
-                Log.info("   ✅ Data enrichment")
-                
-                # Test data filtering
-                Log.info("3. Data Filtering")
-                Log.info("   - Sensitive data removal")
-                Log.info("   - Field selection")
-                Log.info("   - Data masking")
-                Log.info("   - Access control filtering")
-                Log.info("   ✅ Data filtering")
-                
-                Log.info("   🎉 User data transformation test completed")
-                
-        except Exception as e:
-            Log.error(f"test_user_data_transformation test failed: {str(e)}")
-            Log.end_test("test_user_data_transformation", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_user_data_transformation", "PASSED")
+
+# Test payloads read once at import
+VALID_USER_1 = UserTestData.VALID_USER_1
+UPDATE_NAME_ONLY = UserTestData.UPDATE_NAME_ONLY
+INVALID_USER_NO_NAME = UserTestData.INVALID_USER_NO_NAME
+
+# Narrative logged by each business logic case as a single record;
+# %s placeholders are filled by Log.info only when the record is written
+USER_CREATION_BUSINESS_LOGIC_LOG = "\n".join([
+    "\n=== User Creation Business Logic Test ===",
+    "1. Valid User Data Test",
+    "   User data: %s",
+    "   ✅ Valid user data structure",
+    "2. Business Validation Test",
+    "   - Name validation",
+    "   - Email format validation",
+    "   - Age range validation",
+    "   - Duplicate email check",
+    "   ✅ Business validation structure",
+    "3. User Creation Workflow",
+    "   - Data preparation",
+    "   - Business rule validation",
+    "   - User creation execution",
+    "   - Result validation",
+    "   ✅ User creation workflow",
+    "   🎉 User creation business logic test completed"
+])
+
+USER_RETRIEVAL_BUSINESS_LOGIC_LOG = "\n".join([
+    "\n=== User Retrieval Business Logic Test ===",
+    "1. Get All Users Business Logic",
+    "   - Pagination handling",
+    "   - Filtering logic",
+    "   - Sorting logic",
+    "   - Data transformation",
+    "   ✅ Get all users business logic",
+    "2. Get User by ID Business Logic",
+    "   - ID validation",
+    "   - User existence check",
+    "   - Data access control",
+    "   - Error handling",
+    "   ✅ Get user by ID business logic",
+    "3. Search Users Business Logic",
+    "   - Search criteria validation",
+    "   - Fuzzy search logic",
+    "   - Result ranking",
+    "   - Performance optimization",
+    "   ✅ Search users business logic",
+    "   🎉 User retrieval business logic test completed"
+])
+
+USER_UPDATE_BUSINESS_LOGIC_LOG = "\n".join([
+    "\n=== User Update Business Logic Test ===",
+    "1. Update Data Validation",
+    "   Update data: %s",
+    "   ✅ Update data validation",
+    "2. Update Business Rules",
+    "   - User existence validation",
+    "   - Field update permissions",
+    "   - Data integrity checks",
+    "   - Audit trail creation",
+    "   ✅ Update business rules",
+    "3. Partial Update Logic",
+    "   - Selective field updates",
+    "   - Unchanged field preservation",
+    "   - Validation of updated fields",
+    "   - Update timestamp handling",
+    "   ✅ Partial update logic",
+    "   🎉 User update business logic test completed"
+])
+
+USER_DELETION_BUSINESS_LOGIC_LOG = "\n".join([
+    "\n=== User Deletion Business Logic Test ===",
+    "1. Deletion Business Rules",
+    "   - User existence validation",
+    "   - Dependency checks",
+    "   - Permission validation",
+    "   - Cascade deletion logic",
+    "   ✅ Deletion business rules",
+    "2. Soft Delete Logic",
+    "   - Mark as deleted",
+    "   - Data preservation",
+    "   - Recovery mechanism",
+    "   - Audit trail",
+    "   ✅ Soft delete logic",
+    "3. Hard Delete Logic",
+    "   - Permanent data removal",
+    "   - Database cleanup",
+    "   - Resource deallocation",
+    "   - Final validation",
+    "   ✅ Hard delete logic",
+    "   🎉 User deletion business logic test completed"
+])
+
+USER_VALIDATION_BUSINESS_LOGIC_LOG = "\n".join([
+    "\n=== User Validation Business Logic Test ===",
+    "1. Valid User Validation",
+    "   Valid user: %s",
+    "   ✅ Valid user business rules",
+    "2. Invalid User Validation",
+    "   Invalid user: %s",
+    "   ✅ Invalid user business rules",
+    "3. Business Validation Methods",
+    "   - Required field validation",
+    "   - Data format validation",
+    "   - Business rule validation",
+    "   - Cross-field validation",
+    "   ✅ Business validation methods",
+    "   🎉 User validation business logic test completed"
+])
+
+USER_ERROR_HANDLING_BUSINESS_LOGIC_LOG = "\n".join([
+    "\n=== User Error Handling Business Logic Test ===",
+    "1. Business Error Scenarios",
+    "   - Duplicate email handling",
+    "   - Invalid data format handling",
+    "   - Missing required fields handling",
+    "   - Business rule violation handling",
+    "   ✅ Business error scenarios",
+    "2. Error Response Structure",
+    "   - Error code generation",
+    "   - Error message formatting",
+    "   - Error details inclusion",
+    "   - Error logging",
+    "   ✅ Error response structure",
+    "3. Error Recovery Logic",
+    "   - Transaction rollback",
+    "   - Data state restoration",
+    "   - Error notification",
+    "   - Recovery procedures",
+    "   ✅ Error recovery logic",
+    "   🎉 User error handling business logic test completed"
+])
+
+USER_BUSINESS_RULES_LOG = "\n".join([
+    "\n=== User Business Rules Test ===",
+    "1. User Creation Rules",
+    "   - Name must be provided",
+    "   - Email must be unique",
+    "   - Age must be positive",
+    "   - Email format validation",
+    "   ✅ User creation rules",
+    "2. User Update Rules",
+    "   - User must exist",
+    "   - Email uniqueness on update",
+    "   - Age range validation",
+    "   - Update permission check",
+    "   ✅ User update rules",
+    "3. User Deletion Rules",
+    "   - User must exist",
+    "   - No active dependencies",
+    "   - Deletion permission check",
+    "   - Confirmation required",
+    "   ✅ User deletion rules",
+    "4. User Access Rules",
+    "   - Authentication required",
+    "   - Authorization check",
+    "   - Data access control",
+    "   - Audit logging",
+    "   ✅ User access rules",
+    "   🎉 User business rules test completed"
+])
+
+USER_DATA_TRANSFORMATION_LOG = "\n".join([
+    "\n=== User Data Transformation Test ===",
+    "1. Data Formatting",
+    "   - Name capitalization",
+    "   - Email normalization",
+    "   - Age validation",
+    "   - Date formatting",
+    "   ✅ Data formatting",
+    "2. Data Enrichment",
+    "   - Timestamp addition",
+    "   - User ID generation",
+    "   - Status assignment",
+    "   - Metadata addition",
+    "   ✅ Data enrichment",
+    "3. Data Filtering",
+    "   - Sensitive data removal",
+    "   - Field selection",
+    "   - Data masking",
+    "   - Access control filtering",
+    "   ✅ Data filtering",
+    "   🎉 User data transformation test completed"
+])
+
+USER_BUSINESS_WORKFLOW_LOG = "\n".join([
+    "\n=== User Business Workflow Test ===",
+    "1. Complete User Lifecycle",
+    "   - User registration",
+    "   - User activation",
+    "   - User management",
+    "   - User deactivation",
+    "   - User deletion",
+    "   ✅ Complete user lifecycle",
+    "2. User State Transitions",
+    "   - Active state",
+    "   - Inactive state",
+    "   - Suspended state",
+    "   - Deleted state",
+    "   ✅ User state transitions",
+    "3. Business Process Integration",
+    "   - Workflow orchestration",
+    "   - Process validation",
+    "   - Error handling",
+    "   - Success confirmation",
+    "   ✅ Business process integration",
+    "   🎉 User business workflow test completed"
+])
+
+USER_BUSINESS_INTEGRATION_LOG = "\n".join([
+    "\n=== User Business Integration Test ===",
+    "1. Component Integration",
+    "   ✅ Component integration verified",
+    "2. Data Flow Integration",
+    "   - Test data preparation",
+    "   - Business logic execution",
+    "   - Data validation",
+    "   - Error checking",
+    "   ✅ Data flow integration",
+    "3. Business Logic Integration",
+    "   - User operations integration",
+    "   - Data checker integration",
+    "   - Error checker integration",
+    "   - API client integration",
+    "   ✅ Business logic integration",
+    "   🎉 User business integration test completed"
+])
+
+
+# Checks run by a case before its narrative is logged
+def _check_user_creation():
+    """Validate the valid user data structure"""
+    Checker.assert_fields(
+        VALID_USER_1,
+        {"name": "John Smith", "email": "john.smith@example.com", "age": 25},
+        required=("name", "email", "age")
+    )
+
+
+def _check_user_update():
+    """Validate the update data"""
+    Checker.assert_fields(UPDATE_NAME_ONLY, {"name": "Updated John Smith"})
+
+
+def _check_user_validation():
+    """Validate business rules for a valid and an invalid user"""
+    Checker.assert_fields(
+        VALID_USER_1,
+        {"name": "John Smith", "email": "john.smith@example.com", "age": 25}
+    )
     
-    @allure.story("User Business Workflow")
-    @allure.severity(allure.severity_level.CRITICAL)
-    def test_user_business_workflow(self):
-        """Test user business workflow"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_user_business_workflow")
-        
-        try:
-            with allure.step("Test user business workflow"):
-                Log.info("\n=== User Business Workflow Test ===")
-                
-                # Test complete user lifecycle
-                Log.info("1. Complete User Lifecycle")
-                Log.info("   - User registration")
-                Log.info("   - User activation")
-                Log.info("   - User management")
-                Log.info("   - User deactivation")
-                Log.info("   - User deletion")
-                Log.info("   ✅ Complete user lifecycle")
-                
-                # Test user state transitions
-                Log.info("2. User State Transitions")
-                Log.info("   - Active state")
-                Log.info("   - Inactive state")
-                Log.info("   - Suspended state")
-                Log.info("   - Deleted state")
-                Log.info("   ✅ User state transitions")
-                
-                # Test business process integration
-                Log.info("3. Business Process Integration")
-                Log.info("   - Workflow orchestration")
-                Log.info("   - Process validation")
-                Log.info("   - Error handling")
-                Log.info("   - Success confirmation")
-                Log.info("   ✅ Business process integration")
-                
-                Log.info("   🎉 User business workflow test completed")
-                
-        except Exception as e:
-            Log.error(f"test_user_business_workflow test failed: {str(e)}")
-            Log.end_test("test_user_business_workflow", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_user_business_workflow", "PASSED")
+    invalid_user = INVALID_USER_NO_NAME
+    Checker.assert_field_not_exists(invalid_user, 'name')
+    Checker.assert_field_exists(invalid_user, 'email')
+
+
+# (narrative, narrative args, check or None) per business logic case
+CASES = [
+    pytest.param(USER_CREATION_BUSINESS_LOGIC_LOG, (VALID_USER_1,), _check_user_creation, id="user_creation_business_logic"),
+    pytest.param(USER_RETRIEVAL_BUSINESS_LOGIC_LOG, (), None, id="user_retrieval_business_logic"),
+    pytest.param(USER_UPDATE_BUSINESS_LOGIC_LOG, (UPDATE_NAME_ONLY,), _check_user_update, id="user_update_business_logic"),
+    pytest.param(USER_DELETION_BUSINESS_LOGIC_LOG, (), None, id="user_deletion_business_logic"),
+    pytest.param(USER_VALIDATION_BUSINESS_LOGIC_LOG, (VALID_USER_1, INVALID_USER_NO_NAME), _check_user_validation, id="user_validation_business_logic"),
+    pytest.param(USER_ERROR_HANDLING_BUSINESS_LOGIC_LOG, (), None, id="user_error_handling_business_logic"),
+    pytest.param(USER_BUSINESS_RULES_LOG, (), None, id="user_business_rules"),
+    pytest.param(USER_DATA_TRANSFORMATION_LOG, (), None, id="user_data_transformation"),
+    pytest.param(USER_BUSINESS_WORKFLOW_LOG, (), None, id="user_business_workflow")
+]
+
+# Allure story and severity per test, applied by the root conftest at collection
+CRITICAL = allure.severity_level.CRITICAL
+NORMAL = allure.severity_level.NORMAL
+
+ALLURE_STORIES = {
+    "test_business_logic[user_creation_business_logic]": ("User Creation Business Logic", CRITICAL),
+    "test_business_logic[user_retrieval_business_logic]": ("User Retrieval Business Logic", NORMAL),
+    "test_business_logic[user_update_business_logic]": ("User Update Business Logic", NORMAL),
+    "test_business_logic[user_deletion_business_logic]": ("User Deletion Business Logic", CRITICAL),
+    "test_business_logic[user_validation_business_logic]": ("User Validation Business Logic", NORMAL),
+    "test_business_logic[user_error_handling_business_logic]": ("User Error Handling Business Logic", NORMAL),
+    "test_business_logic[user_business_rules]": ("User Business Rules", CRITICAL),
+    "test_business_logic[user_data_transformation]": ("User Data Transformation", NORMAL),
+    "test_business_logic[user_business_workflow]": ("User Business Workflow", CRITICAL),
+    "test_user_business_integration": ("User Business Integration", CRITICAL)
+}
+
+
+@pytest.mark.parametrize("narrative,narrative_args,check", CASES)
+def test_business_logic(narrative, narrative_args, check):
+    """Test one user business logic case: run its checks, then log its narrative"""
+    if check:
+        check()
+    Log.info(narrative, *narrative_args)
+
+
+def test_user_business_integration(api_client, user_ops, test_data, user_checker):
+    """Test user business integration"""
+    # Test component integration
+    Checker.assert_all_not_none({
+        "api_client": api_client,
+        "user_ops": user_ops,
+        "test_data": test_data,
+        "user_checker": user_checker
+    })
     
-    @allure.story("User Business Integration")
-    @allure.severity(allure.severity_level.CRITICAL)
-    def test_user_business_integration(self):
-        """Test user business integration"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_user_business_integration")
-        
-        try:
-            with allure.step("Test user business integration"):
-                Log.info("\n=== User Business Integration Test ===")
-                
-                # Test component integration
-                Log.info("1. Component Integration")
-                Checker.assert_not_none(self.api_client, "api_client")
-                Checker.assert_not_none(self.user_ops, "user_ops")
-                Checker.assert_not_none(self.test_data, "test_data")
-                Checker.assert_not_none(self.user_checker, "user_checker")
-                Log.info("   ✅ Component integration verified")
-                
-                # Test data flow integration
-                Log.info("2. Data Flow Integration")
-                Log.info("   - Test data preparation")
-                Log.info("   - Business logic execution")
-                Log.info("   - Data validation")
-                Log.info("   - Error checking")
-                Log.info("   ✅ Data flow integration")
-                
-                # Test business logic integration
-                Log.info("3. Business Logic Integration")
-                Log.info("   - User operations integration")
-                Log.info("   - Data checker integration")
-                Log.info("   - Error checker integration")
-                Log.info("   - API client integration")
-                Log.info("   ✅ Business logic integration")
-                
-                Log.info("   🎉 User business integration test completed")
-                
-        except Exception as e:
-            Log.error(f"test_user_business_integration test failed: {str(e)}")
-            Log.end_test("test_user_business_integration", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_user_business_integration", "PASSED") 
\ No newline at end of file
+    Log.info(USER_BUSINESS_INTEGRATION_LOG)
@@ -1,16 +1,23 @@
-from core.logger import Log, generate_logid
 """
 PTE Framework Structure Demo Tests
 Demonstrates PTE framework structure and functionality
 """
 import pytest
-import os
 import allure
 from config.settings import TestEnvironment
 from api.client import APIClient
 from biz.department.user.operations import UserOperations
 from data.department.user.test_data import UserTestData
 from core.checker import Checker
+from core.logger import Log
+
+# Test payloads read once at import (plain class attributes of UserTestData)
+VALID_USER_1 = UserTestData.VALID_USER_1
+VALID_USER_2 = UserTestData.VALID_USER_2
+INVALID_USER_NO_NAME = UserTestData.INVALID_USER_NO_NAME
+
+# LogID and test start/end logging (with the real outcome) come from the conftest fixtures
+pytestmark = pytest.mark.usefixtures("log_lifecycle")
 
 
 @allure.epic("PTE Framework")
@@ -18,472 +25,304 @@ from core.checker import Checker
 class TestFrameworkStructureDemo:
     """PTE Framework Structure Demo Tests"""
     
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        """Setup test environment"""
-        os.environ['TEST_IDC'] = 'local_test'
-        os.environ['TEST_ENV'] = 'local'
-        
-        # Initialize components from each layer
-        self.api_client = APIClient()
-        self.user_ops = UserOperations()
-        self.test_data = UserTestData()
+    @pytest.fixture(scope="class", autouse=True)
+    def _class_setup(self, request):
+        """Build components from each layer once for the class (environment is set in conftest)"""
+        request.cls.api_client = APIClient()
+        request.cls.user_ops = UserOperations()
+        request.cls.test_data = UserTestData()
     
     @allure.story("Framework Layers")
     @allure.severity(allure.severity_level.CRITICAL)
     def test_framework_layers_demo(self):
         """Demonstrate framework layered structure"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_framework_layers_demo")
-        
-        try:
-            with allure.step("Verify framework layered structure"):
-                Log.info("\n=== Framework Layered Structure Demo ===")
-                
-                # Verify components from each layer
-                Checker.assert_not_none(self.api_client, "api_client")
-                Checker.assert_not_none(self.user_ops, "user_ops")
-                Checker.assert_not_none(self.test_data, "test_data")
-                
-                Log.info("1. API Layer (api)")
-                Log.info("   - APIClient: HTTP request client")
-                Log.info("   ✅ API layer components normal")
-                
-                Log.info("2. Business Layer (biz)")
-                Log.info("   - UserOperations: User business operations")
-                Log.info("   ✅ Business layer components normal")
-                
-                Log.info("3. Data Layer (data)")
-                Log.info("   - UserTestData: User test data")
-                Log.info("   ✅ Data layer components normal")
-                
-                Log.info("4. Core Layer (core)")
-                Log.info("   - Checker: Data checker")
-                Log.info("   ✅ Core layer components normal")
-                
-                Log.info("   🎉 Framework layered structure verification completed")
-                
-        except Exception as e:
-            Log.error(f"test_framework_layers_demo test failed: {str(e)}")
-            Log.end_test("test_framework_layers_demo", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_framework_layers_demo", "PASSED")
+        with allure.step("Verify framework layered structure"):
+            Log.info("\n=== Framework Layered Structure Demo ===")
+            
+            # Verify components from each layer
+            Checker.assert_not_none(self.api_client, "api_client")
+            Checker.assert_not_none(self.user_ops, "user_ops")
+            Checker.assert_not_none(self.test_data, "test_data")
+            
+            Log.info("\n".join([
+                "1. API Layer (api)",
+                "   - APIClient: HTTP request client",
+                "   ✅ API layer components normal",
+                "2. Business Layer (biz)",
+                "   - UserOperations: User business operations",
+                "   ✅ Business layer components normal",
+                "3. Data Layer (data)",
+                "   - UserTestData: User test data",
+                "   ✅ Data layer components normal",
+                "4. Core Layer (core)",
+                "   - Checker: Data checker",
+                "   ✅ Core layer components normal",
+                "   🎉 Framework layered structure verification completed"
+            ]))
     
     @allure.story("Configuration Loading")
     @allure.severity(allure.severity_level.NORMAL)
-    def test_configuration_loading_demo(self):
+    def test_configuration_loading_demo(self, env_config):
         """Demonstrate configuration loading functionality"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_configuration_loading_demo")
-        
-        try:
-            with allure.step("Verify configuration loading functionality"):
-                Log.info("\n=== Configuration Loading Demo ===")
-                
-                # Get configuration information
-                host = TestEnvironment.get_host()
-                headers = TestEnvironment.get_headers()
-                timeout = TestEnvironment.get_timeout()
-                
-                Log.info("1. Host Configuration")
-                Log.info(f"   Host: {host}")
-                Checker.assert_not_none(host, "host")
-                Log.info("   ✅ Host configuration loaded successfully")
-                
-                Log.info("2. Headers Configuration")
-                Log.info(f"   Headers: {headers}")
-                Checker.assert_not_none(headers, "headers")
-                Log.info("   ✅ Headers configuration loaded successfully")
-                
-                Log.info("3. Timeout Configuration")
-                Log.info(f"   Timeout: {timeout} seconds")
-                Checker.assert_true(timeout > 0, "timeout should be greater than 0")
-                Log.info("   ✅ Timeout configuration loaded successfully")
-                
-                Log.info("   🎉 Configuration loading functionality verification completed")
-                
-        except Exception as e:
-            Log.error(f"test_configuration_loading_demo test failed: {str(e)}")
-            Log.end_test("test_configuration_loading_demo", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_configuration_loading_demo", "PASSED")
+        with allure.step("Verify configuration loading functionality"):
+            Log.info("\n=== Configuration Loading Demo ===")
+            
+            # Get configuration information (resolved once per module by env_config)
+            host = env_config["host"]
+            headers = env_config["headers"]
+            timeout = env_config["timeout"]
+            
+            Log.info("1. Host Configuration")
+            Log.info("   Host: %s", host)
+            Checker.assert_not_none(host, "host")
+            Log.info("   ✅ Host configuration loaded successfully")
+            
+            Log.info("2. Headers Configuration")
+            Log.info("   Headers: %s", headers)
+            Checker.assert_not_none(headers, "headers")
+            Log.info("   ✅ Headers configuration loaded successfully")
+            
+            Log.info("3. Timeout Configuration")
+            Log.info("   Timeout: %s seconds", timeout)
+            Checker.assert_true(timeout > 0, "timeout should be greater than 0")
+            Log.info("   ✅ Timeout configuration loaded successfully")
+            
+            Log.info("   🎉 Configuration loading functionality verification completed")
     
     @allure.story("Data Checker")
     @allure.severity(allure.severity_level.NORMAL)
     def test_data_checker_demo(self):
         """Demonstrate data checker functionality"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_data_checker_demo")
-        
-        try:
-            with allure.step("Verify data checker functionality"):
-                Log.info("\n=== Data Checker Demo ===")
-                
-                # Test data
-                test_data = {
-                    "name": "Test User",
-                    "age": 25,
-                    "email": "test@example.com"
-                }
-                
-                Log.info("1. Basic Data Validation")
-                Checker.assert_not_none(test_data)
-                Checker.assert_str_data(test_data["name"])
-                Checker.assert_int_data(test_data["age"])
-                Log.info("   ✅ Basic data validation passed")
-                
-                Log.info("2. Range Validation")
-                Checker.assert_in_range(test_data["age"], 0, 150)
-                Log.info("   ✅ Range validation passed")
-                
-                Log.info("3. String Length Validation")
-                Checker.assert_string_length(test_data["name"], 1, 100)
-                Log.info("   ✅ String length validation passed")
-                
-                Log.info("   🎉 Data checker functionality verification completed")
-                
-        except Exception as e:
-            Log.error(f"test_data_checker_demo test failed: {str(e)}")
-            Log.end_test("test_data_checker_demo", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_data_checker_demo", "PASSED")
+        with allure.step("Verify data checker functionality"):
+            Log.info("\n=== Data Checker Demo ===")
+            
+            # Test data
+            test_data = {
+                "name": "Test User",
+                "age": 25,
+                "email": "test@example.com"
+            }
+            
+            Log.info("1. Basic Data Validation")
+            Checker.assert_not_none(test_data)
+            Checker.assert_str_data(test_data["name"])
+            Checker.assert_int_data(test_data["age"])
+            Log.info("   ✅ Basic data validation passed")
+            
+            Log.info("2. Range Validation")
+            Checker.assert_in_range(test_data["age"], 0, 150)
+            Log.info("   ✅ Range validation passed")
+            
+            Log.info("3. String Length Validation")
+            Checker.assert_string_length(test_data["name"], 1, 100)
+            Log.info("   ✅ String length validation passed")
+            
+            Log.info("   🎉 Data checker functionality verification completed")
     
     @allure.story("API Client")
     @allure.severity(allure.severity_level.NORMAL)
-    def test_api_client_demo(self):
+    def test_api_client_demo(self, env_config):
         """Demonstrate API client functionality"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_api_client_demo")
-        
-        try:
-            with allure.step("Verify API client functionality"):
-                Log.info("\n=== API Client Demo ===")
-                
-                # Get configuration
-                host = TestEnvironment.get_host()
-                headers = TestEnvironment.get_headers()
-                
-                Log.info("1. Host: {host}")
-                Log.info("2. Headers: {headers}")
-                
-                # Verify client configuration
-                Checker.assert_attr_equal(self.api_client, 'host', host)  # Use host instead of base_url
-                
-                # Check that API client headers contain the original headers plus logId
-                expected_headers = headers.copy()
-                Checker.assert_contains(self.api_client.headers, 'logId')  # API client should have logId
-                # Remove logId for comparison with original headers
-                api_headers_without_logid = {k: v for k, v in self.api_client.headers.items() if k != 'logId'}
-                Checker.assert_dict_equal(api_headers_without_logid, expected_headers)
-                Log.info("   ✅ API client configuration correct")
-                
-                Log.info("   🎉 API client functionality verification completed")
-                
-        except Exception as e:
-            Log.error(f"test_api_client_demo test failed: {str(e)}")
-            Log.end_test("test_api_client_demo", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_api_client_demo", "PASSED")
+        with allure.step("Verify API client functionality"):
+            Log.info("\n=== API Client Demo ===")
+            
+            # Get configuration
+            host = env_config["host"]
+            headers = env_config["headers"]
+            
+            Log.info("1. Host: %s", host)
+            Log.info("2. Headers: %s", headers)
+            
+            # Verify client configuration
+            Checker.assert_attr_equal(self.api_client, 'host', host)  # Use host instead of base_url
+            
+            # Check that API client headers contain the original headers plus logId
+            expected_headers = headers.copy()
+            Checker.assert_contains(self.api_client.headers, 'logId')  # API client should have logId
+            # Remove logId for comparison with original headers
+            api_headers_without_logid = self.api_client.headers.copy()
+            api_headers_without_logid.pop('logId', None)
+            Checker.assert_dict_equal(api_headers_without_logid, expected_headers)
+            Log.info("   ✅ API client configuration correct")
+            
+            Log.info("   🎉 API client functionality verification completed")
     
     @allure.story("Business Operations")
     @allure.severity(allure.severity_level.NORMAL)
     def test_business_operations_demo(self):
         """Demonstrate business operations functionality"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_business_operations_demo")
-        
-        try:
-            with allure.step("Verify business operations functionality"):
-                Log.info("\n=== Business Operations Demo ===")
-                
-                # Get test data
-                user_data = self.test_data.VALID_USER_1  # Use static property instead of method
-                
-                # Verify test data
-                Checker.assert_field_value(user_data, "name", "John Smith")
-                Checker.assert_field_value(user_data, "email", "john.smith@example.com")
-                Checker.assert_field_value(user_data, "age", 25)
-                Log.info("   ✅ Test data validation correct")
-                
-                # Demonstrate business operations (not actually executed, just demonstrate interface)
-                Log.info("   📝 Business operations interface:")
-                Log.info("   - get_all_users()")
-                Log.info("   - get_user_by_id(user_id)")
-                Log.info("   - create_user(user_data)")
-                Log.info("   - update_user(user_id, update_data)")
-                Log.info("   - delete_user(user_id)")
-                Log.info("   ✅ Business operations interface complete")
-                
-                Log.info("   🎉 Business operations functionality verification completed")
-                
-        except Exception as e:
-            Log.error(f"test_business_operations_demo test failed: {str(e)}")
-            Log.end_test("test_business_operations_demo", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_business_operations_demo", "PASSED")
+        with allure.step("Verify business operations functionality"):
+            Log.info("\n=== Business Operations Demo ===")
+            
+            # Get test data
+            user_data = VALID_USER_1
+            
+            # Verify test data
+            Checker.assert_field_value(user_data, "name", "John Smith")
+            Checker.assert_field_value(user_data, "email", "john.smith@example.com")
+            Checker.assert_field_value(user_data, "age", 25)
+            Log.info("   ✅ Test data validation correct")
+            
+            # Demonstrate business operations (not actually executed, just demonstrate interface)
+            Log.info("\n".join([
+                "   📝 Business operations interface:",
+                "   - get_all_users()",
+                "   - get_user_by_id(user_id)",
+                "   - create_user(user_data)",
+                "   - update_user(user_id, update_data)",
+                "   - delete_user(user_id)",
+                "   ✅ Business operations interface complete",
+                "   🎉 Business operations functionality verification completed"
+            ]))
     
     @allure.story("Test Data")
     @allure.severity(allure.severity_level.NORMAL)
     def test_test_data_demo(self):
         """Demonstrate test data functionality"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_test_data_demo")
-        
-        try:
-            with allure.step("Verify test data functionality"):
-                Log.info("\n=== Test Data Demo ===")
-                
-                # Get different types of test data
-                valid_data = self.test_data.VALID_USER_1  # Use static property
-                invalid_data = self.test_data.INVALID_USER_NO_NAME  # Use static property
-                edge_case_data = self.test_data.VALID_USER_2  # Use static property
-                
-                # Verify valid data
-                Checker.assert_field_exists(valid_data, "name")
-                Checker.assert_field_exists(valid_data, "email")
-                Checker.assert_field_exists(valid_data, "age")
-                Log.info("   ✅ Valid data format correct")
-                
-                # Verify invalid data
-                Checker.assert_field_not_exists(invalid_data, "name")
-                Checker.assert_field_exists(invalid_data, "email")
-                Log.info("   ✅ Invalid data format correct")
-                
-                # Verify boundary data
-                Checker.assert_field_value(edge_case_data, "age", 30)
-                Log.info("   ✅ Boundary data format correct")
-                
-                # Demonstrate test data methods
-                valid_users = self.test_data.get_valid_users()
-                invalid_users = self.test_data.get_invalid_users()
-                update_data_sets = self.test_data.get_update_data_sets()
-                
-                Checker.assert_length(valid_users, 3)
-                Checker.assert_length(invalid_users, 3)
-                Checker.assert_length(update_data_sets, 3)
-                Log.info("   ✅ Test data methods available")
-                
-                Log.info("   🎉 Test data functionality verification completed")
-                
-        except Exception as e:
-            Log.error(f"test_test_data_demo test failed: {str(e)}")
-            Log.end_test("test_test_data_demo", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_test_data_demo", "PASSED")
+        with allure.step("Verify test data functionality"):
+            Log.info("\n=== Test Data Demo ===")
+            
+            # Get different types of test data
+            valid_data = VALID_USER_1
+            invalid_data = INVALID_USER_NO_NAME
+            edge_case_data = VALID_USER_2
+            
+            # Verify valid data
+            Checker.assert_field_exists(valid_data, "name")
+            Checker.assert_field_exists(valid_data, "email")
+            Checker.assert_field_exists(valid_data, "age")
+            Log.info("   ✅ Valid data format correct")
+            
+            # Verify invalid data
+            Checker.assert_field_not_exists(invalid_data, "name")
+            Checker.assert_field_exists(invalid_data, "email")
+            Log.info("   ✅ Invalid data format correct")
+            
+            # Verify boundary data
+            Checker.assert_field_value(edge_case_data, "age", 30)
+            Log.info("   ✅ Boundary data format correct")
+            
+            # Demonstrate test data methods
+            valid_users = self.test_data.get_valid_users()
+            invalid_users = self.test_data.get_invalid_users()
+            update_data_sets = self.test_data.get_update_data_sets()
+            
+            Checker.assert_length(valid_users, 3)
+            Checker.assert_length(invalid_users, 3)
+            Checker.assert_length(update_data_sets, 3)
+            Log.info("   ✅ Test data methods available")
+            
+            Log.info("   🎉 Test data functionality verification completed")
     
     @allure.story("Environment Switching")
     @allure.severity(allure.severity_level.NORMAL)
-    def test_environment_switching_demo(self):
+    @pytest.mark.parametrize("idc", [
+        'local_test',
+        # Only the local_test environment is tested; the others are skipped before the body runs
+        pytest.param('aws_offline', marks=pytest.mark.skip(reason="aws_offline is not a local environment")),
+        pytest.param('gcp_offline', marks=pytest.mark.skip(reason="gcp_offline is not a local environment"))
+    ])
+    def test_environment_switching_demo(self, idc, monkeypatch):
         """Demonstrate environment switching functionality"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_environment_switching_demo")
-        
-        try:
-            with allure.step("Verify environment switching functionality"):
-                Log.info("\n=== Environment Switching Demo ===")
-                
-                # Test different IDC configurations
-                test_idcs = ['local_test', 'aws_offline', 'gcp_offline']
-                
-                for idc in test_idcs:
-                    with allure.step(f"Switch to IDC: {idc}"):
-                        Log.info(f"1. Switch to IDC: {idc}")
-                        os.environ['TEST_IDC'] = idc
-                        
-                        # Get configuration
-                        current_idc = TestEnvironment.get_current_idc()
-                        Log.info(f"   Current IDC: {current_idc}")
-                        
-                        # Only test local_test environment, skip other environments
-                        if idc == 'local_test':
-                            host = TestEnvironment.get_host()
-                            Log.info(f"   Host: {host}")
-                            Log.info("   ✅ Environment switching successful")
-                        else:
-                            Log.info("   ⏭️  Skip non-local environment tests")
-                            continue
-                
-                Log.info("   🎉 Environment switching functionality verification completed")
-                
-        except Exception as e:
-            Log.error(f"test_environment_switching_demo test failed: {str(e)}")
-            Log.end_test("test_environment_switching_demo", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_environment_switching_demo", "PASSED")
+        with allure.step(f"Switch to IDC: {idc}"):
+            Log.info("\n=== Environment Switching Demo ===")
+            Log.info("1. Switch to IDC: %s", idc)
+            # Restored after the test, so the switch does not leak into later tests
+            monkeypatch.setenv('TEST_IDC', idc)
+            
+            # Get configuration
+            current_idc = TestEnvironment.get_current_idc()
+            Log.info("   Current IDC: %s", current_idc)
+            
+            host = TestEnvironment.get_host()
+            Log.info("   Host: %s", host)
+            Log.info("   ✅ Environment switching successful")
+            
+            Log.info("   🎉 Environment switching functionality verification completed")
     
     @allure.story("Framework Integration")
     @allure.severity(allure.severity_level.CRITICAL)
     def test_framework_integration_demo(self):
         """Demonstrate framework integration functionality"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_framework_integration_demo")
-        
-        try:
-            with allure.step("Verify framework integration functionality"):
-                Log.info("\n=== Framework Integration Demo ===")
-                
-                # Simulate complete test workflow
-                Log.info("1. Prepare test data")
-                user_data = self.test_data.VALID_USER_1  # Use static property
-                
-                Log.info("2. Verify business operations")
-                Checker.assert_not_none(self.user_ops, "user_ops")
-                Log.info("   ✅ Business operations available")
-                
-                Log.info("3. Verify API client")
-                Checker.assert_not_none(self.api_client, "api_client")
-                Log.info("   ✅ API client available")
-                
-                Log.info("4. Verify test data")
-                Checker.assert_not_none(self.test_data, "test_data")
-                Log.info("   ✅ Test data available")
-                
-                Log.info("   🎉 Framework integration demo completed")
-                
-        except Exception as e:
-            Log.error(f"test_framework_integration_demo test failed: {str(e)}")
-            Log.end_test("test_framework_integration_demo", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_framework_integration_demo", "PASSED")
+        with allure.step("Verify framework integration functionality"):
+            Log.info("\n=== Framework Integration Demo ===")
+            
+            # Simulate complete test workflow
+            Log.info("1. Prepare test data")
+            user_data = VALID_USER_1
+            
+            Log.info("2. Verify business operations")
+            Checker.assert_not_none(self.user_ops, "user_ops")
+            Log.info("   ✅ Business operations available")
+            
+            Log.info("3. Verify API client")
+            Checker.assert_not_none(self.api_client, "api_client")
+            Log.info("   ✅ API client available")
+            
+            Log.info("4. Verify test data")
+            Checker.assert_not_none(self.test_data, "test_data")
+            Log.info("   ✅ Test data available")
+            
+            Log.info("   🎉 Framework integration demo completed")
     
     @allure.story("Error Handling")
     @allure.severity(allure.severity_level.NORMAL)
     def test_error_handling_demo(self):
         """Demonstrate error handling functionality"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_error_handling_demo")
-        
-        try:
-            with allure.step("Verify error handling functionality"):
-                Log.info("\n=== Error Handling Demo ===")
-                
-                # Test invalid data
-                invalid_data = self.test_data.INVALID_USER_NO_NAME  # Use static property
-                
-                # Verify invalid data
-                Checker.assert_field_not_exists(invalid_data, "name")
-                Checker.assert_field_exists(invalid_data, "email")
-                Log.info("   ✅ Invalid data identification correct")
-                
-                # Demonstrate error handling
-                Log.info("   📝 Error handling mechanism:")
-                Log.info("   - Data validation errors")
-                Log.info("   - API request errors")
-                Log.info("   - Business logic errors")
-                Log.info("   - System exception errors")
-                Log.info("   ✅ Error handling mechanism complete")
-                
-                # Demonstrate data checker error handling
-                try:
-                    Checker.assert_not_none(invalid_data)
-                    Log.info("   ✅ Data checker error handling normal")
-                except Exception as e:
-                    Log.info(f"   ⚠️  Expected error handling: {type(e).__name__}")
-                
-                Log.info("   🎉 Error handling demo completed")
-                
-        except Exception as e:
-            Log.error(f"test_error_handling_demo test failed: {str(e)}")
-            Log.end_test("test_error_handling_demo", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_error_handling_demo", "PASSED")
+        with allure.step("Verify error handling functionality"):
+            Log.info("\n=== Error Handling Demo ===")
+            
+            # Test invalid data
+            invalid_data = INVALID_USER_NO_NAME
+            
+            # Verify invalid data
+            Checker.assert_field_not_exists(invalid_data, "name")
+            Checker.assert_field_exists(invalid_data, "email")
+            Log.info("   ✅ Invalid data identification correct")
+            
+            # Demonstrate error handling
+            Log.info("\n".join([
+                "   📝 Error handling mechanism:",
+                "   - Data validation errors",
+                "   - API request errors",
+                "   - Business logic errors",
+                "   - System exception errors",
+                "   ✅ Error handling mechanism complete"
+            ]))
+            
+            # Demonstrate data checker error handling
+            try:
+                Checker.assert_not_none(invalid_data)
+                Log.info("   ✅ Data checker error handling normal")
+            except Exception as e:
+                Log.info("   ⚠️  Expected error handling: %s", type(e).__name__)
+            
+            Log.info("   🎉 Error handling demo completed")
     
     @allure.story("Framework Extensibility")
     @allure.severity(allure.severity_level.NORMAL)
     def test_framework_extensibility_demo(self):
         """Demonstrate framework extensibility"""
-        # Step 1: Set LogID
-        logid = generate_logid()
-        Log.set_logid(logid)
-        
-        # Step 2: Start test
-        Log.start_test("test_framework_extensibility_demo")
-        
-        try:
-            with allure.step("Verify framework extensibility"):
-                Log.info("\n=== Framework Extensibility Demo ===")
-                
-                # Demonstrate extension points
-                Log.info("1. Data Checker Extension")
-                Log.info("   - Inherit Checker class")
-                Log.info("   - Add custom validation methods")
-                Log.info("   ✅ Data checker extensible")
-                
-                Log.info("2. Business Operations Extension")
-                Log.info("   - Inherit UserOperations class")
-                Log.info("   - Add new business methods")
-                Log.info("   ✅ Business operations extensible")
-                
-                Log.info("3. Test Data Extension")
-                Log.info("   - Inherit UserTestData class")
-                Log.info("   - Add new test data")
-                Log.info("   ✅ Test data extensible")
-                
-                Log.info("4. Configuration Management Extension")
-                Log.info("   - Add new environment configurations")
-                Log.info("   - Extend configuration validation logic")
-                Log.info("   ✅ Configuration management extensible")
-                
-                Log.info("   🎉 Framework extensibility verification completed")
-                
-        except Exception as e:
-            Log.error(f"test_framework_extensibility_demo test failed: {str(e)}")
-            Log.end_test("test_framework_extensibility_demo", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_framework_extensibility_demo", "PASSED")
+        with allure.step("Verify framework extensibility"):
+            Log.info("\n=== Framework Extensibility Demo ===")
+            
+            # Demonstrate extension points
+            Log.info("\n".join([
+                "1. Data Checker Extension",
+                "   - Inherit Checker class",
+                "   - Add custom validation methods",
+                "   ✅ Data checker extensible",
+                "2. Business Operations Extension",
+                "   - Inherit UserOperations class",
+                "   - Add new business methods",
+                "   ✅ Business operations extensible",
+                "3. Test Data Extension",
+                "   - Inherit UserTestData class",
+                "   - Add new test data",
+                "   ✅ Test data extensible",
+                "4. Configuration Management Extension",
+                "   - Add new environment configurations",
+                "   - Extend configuration validation logic",
+                "   ✅ Configuration management extensible",
+                "   🎉 Framework extensibility verification completed"
+            ]))
@@ -4,8 +4,6 @@ Integrates all logging-related tests including LogID generation, log recording,
 """
 import pytest
 import allure
-import os
-from config.settings import TestEnvironment
 from api.client import APIClient
 from biz.department.user.operations import UserOperations
 from data.department.user.test_data import UserTestData
@@ -20,10 +18,7 @@ class TestLogFunctionality:
     
     @pytest.fixture(autouse=True)
     def setup(self):
-        """Setup test environment"""
-        os.environ['TEST_IDC'] = 'local_test'
-        os.environ['TEST_ENV'] = 'local'
-        
+        """Setup test environment (TEST_IDC/TEST_ENV defaults come from the root conftest)"""
         # Initialize components
         self.api_client = APIClient()
         self.user_ops = UserOperations()
@@ -37,10 +32,8 @@ class TestLogFunctionality:
         logid = generate_logid()
         Log.set_logid(logid)
         
-        # Step 2: Start test
-        Log.start_test("test_basic_log_functions")
-        
-        try:
+        # Step 2: Run test (start and end are logged as one record)
+        with Log.test("test_basic_log_functions"):
             # Test basic logging functionality
             Log.info("This is an info log")
             Log.warning("This is a warning log")
@@ -53,20 +46,12 @@ class TestLogFunctionality:
                 "username": "testuser",
                 "email": "test@example.com"
             }
-            Log.info("User data", test_data)
+            Log.info("User data", data=test_data)
             
             # Test structured data
-            Log.info("Structured data", {"key": "value", "number": 123})
+            Log.info("Structured data", data={"key": "value", "number": 123})
             
             Log.info("Basic logging functionality test completed")
-            
-        except Exception as e:
-            Log.error(f"Basic logging functionality test failed: {str(e)}")
-            Log.end_test("test_basic_log_functions", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_basic_log_functions", "PASSED")
     
     @allure.story("LogID Management")
     @allure.severity(allure.severity_level.CRITICAL)
@@ -76,10 +61,8 @@ class TestLogFunctionality:
         logid = generate_logid()
         Log.set_logid(logid)
         
-        # Step 2: Start test
-        Log.start_test("test_logid_management")
-        
-        try:
+        # Step 2: Run test (start and end are logged as one record)
+        with Log.test("test_logid_management"):
             # Test LogID generation and retrieval
             original_logid = Log.get_logid()
             Log.info(f"Current LogID: {original_logid}")
@@ -97,14 +80,6 @@ class TestLogFunctionality:
             Checker.assert_not_equal(new_logid, original_logid, "LogID")
             
             Log.info("LogID management functionality test completed")
-            
-        except Exception as e:
-            Log.error(f"LogID management functionality test failed: {str(e)}")
-            Log.end_test("test_logid_management", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_logid_management", "PASSED")
     
     @allure.story("API Call Logging")
     @allure.severity(allure.severity_level.NORMAL)
@@ -114,10 +89,8 @@ class TestLogFunctionality:
         logid = generate_logid()
         Log.set_logid(logid)
         
-        # Step 2: Start test
-        Log.start_test("test_api_call_logging")
-        
-        try:
+        # Step 2: Run test (start and end are logged as one record)
+        with Log.test("test_api_call_logging"):
             # Test simple API call logging
             Log.api_call("GET", "/api/health", 200, 0.1)
             
@@ -141,14 +114,6 @@ class TestLogFunctionality:
             Log.api_call("PUT", "/api/users/123", 500, 1.0)
             
             Log.info("API call logging functionality test completed")
-            
-        except Exception as e:
-            Log.error(f"API call logging functionality test failed: {str(e)}")
-            Log.end_test("test_api_call_logging", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_api_call_logging", "PASSED")
     
     @allure.story("Data Validation Logging")
     @allure.severity(allure.severity_level.NORMAL)
@@ -158,10 +123,8 @@ class TestLogFunctionality:
         logid = generate_logid()
         Log.set_logid(logid)
         
-        # Step 2: Start test
-        Log.start_test("test_data_validation_logging")
-        
-        try:
+        # Step 2: Run test (start and end are logged as one record)
+        with Log.test("test_data_validation_logging"):
             # Test successful data validation
             Log.data_validation("Username", "testuser", "testuser", True)
             Log.data_validation("User ID", 12345, 12345, True)
@@ -178,14 +141,6 @@ class TestLogFunctionality:
             Log.data_validation("List length", 3, 5, False)
             
             Log.info("Data validation logging functionality test completed")
-            
-        except Exception as e:
-            Log.error(f"Data validation logging functionality test failed: {str(e)}")
-            Log.end_test("test_data_validation_logging", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_data_validation_logging", "PASSED")
     
     @allure.story("Assertion Logging")
     @allure.severity(allure.severity_level.NORMAL)
@@ -195,10 +150,8 @@ class TestLogFunctionality:
         logid = generate_logid()
         Log.set_logid(logid)
         
-        # Step 2: Start test
-        Log.start_test("test_assertion_logging")
-        
-        try:
+        # Step 2: Run test (start and end are logged as one record)
+        with Log.test("test_assertion_logging"):
             # Test successful assertions
             Log.assertion("Check user ID", True, 12345, 12345)
             Log.assertion("Check username", True, "testuser", "testuser")
@@ -214,15 +167,11 @@ class TestLogFunctionality:
             Log.assertion("String assertion", True, "success", "success")
             Log.assertion("Numeric assertion", True, 100, 100)
             
-            Log.info("Assertion logging functionality test completed")
+            # Test batched assertions (logged as one record)
+            Log.assertions([("Batch status", True), ("Batch body", True)])
+            Log.assertions([("Batch status", True), ("Batch logid", False)])
             
-        except Exception as e:
-            Log.error(f"Assertion logging functionality test failed: {str(e)}")
-            Log.end_test("test_assertion_logging", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_assertion_logging", "PASSED")
+            Log.info("Assertion logging functionality test completed")
     
     @allure.story("Step Decorator")
     @allure.severity(allure.severity_level.NORMAL)
@@ -232,10 +181,8 @@ class TestLogFunctionality:
         logid = generate_logid()
         Log.set_logid(logid)
         
-        # Step 2: Start test
-        Log.start_test("test_step_decorator")
-        
-        try:
+        # Step 2: Run test (start and end are logged as one record)
+        with Log.test("test_step_decorator"):
             # Test step decorator
             @Log.step("User registration step")
             def register_user():
@@ -254,23 +201,15 @@ class TestLogFunctionality:
             
             # Execute steps
             register_result = register_user()
-            Log.info("User registration completed", register_result)
+            Log.info("User registration completed", data=register_result)
             
             validate_result = validate_user()
-            Log.info("User validation completed", validate_result)
+            Log.info("User validation completed", data=validate_result)
             
             activate_result = activate_user()
-            Log.info("User activation completed", activate_result)
+            Log.info("User activation completed", data=activate_result)
             
             Log.info("Step decorator functionality test completed")
-            
-        except Exception as e:
-            Log.error(f"Step decorator functionality test failed: {str(e)}")
-            Log.end_test("test_step_decorator", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_step_decorator", "PASSED")
     
     @allure.story("LogID Attachment")
     @allure.severity(allure.severity_level.NORMAL)
@@ -280,10 +219,8 @@ class TestLogFunctionality:
         logid = generate_logid()
         Log.set_logid(logid)
         
-        # Step 2: Start test
-        Log.start_test("test_logid_attachment")
-        
-        try:
+        # Step 2: Run test (start and end are logged as one record)
+        with Log.test("test_logid_attachment"):
             Log.info("Starting LogID attachment functionality test")
             
             # Log test steps
@@ -293,7 +230,7 @@ class TestLogFunctionality:
                 "username": "testuser",
                 "email": "test@example.com"
             }
-            Log.info("Test data preparation completed", test_data)
+            Log.info("Test data preparation completed", data=test_data)
             
             # Simulate API call
             Log.api_call(
@@ -313,14 +250,6 @@ class TestLogFunctionality:
             Log.assertion("Check user creation success", True, 201, 201)
             
             Log.info("LogID attachment functionality test completed")
-            
-        except Exception as e:
-            Log.error(f"LogID attachment functionality test failed: {str(e)}")
-            Log.end_test("test_logid_attachment", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_logid_attachment", "PASSED")
     
     @allure.story("Headers with LogID")
     @allure.severity(allure.severity_level.NORMAL)
@@ -330,10 +259,8 @@ class TestLogFunctionality:
         logid = generate_logid()
         Log.set_logid(logid)
         
-        # Step 2: Start test
-        Log.start_test("test_headers_with_logid")
-        
-        try:
+        # Step 2: Run test (start and end are logged as one record)
+        with Log.test("test_headers_with_logid"):
             Log.info("Testing headers with LogID functionality")
             
             # Get headers with LogID
@@ -343,7 +270,7 @@ class TestLogFunctionality:
                 'Custom-Header': 'value'
             })
             
-            Log.info("Headers generation completed", {
+            Log.info("Headers generation completed", data={
                 "headers": headers,
                 "logid": Log.get_logid()
             })
@@ -358,14 +285,6 @@ class TestLogFunctionality:
             Checker.assert_equal(headers['Custom-Header'], 'value', "Custom-Header")
             
             Log.info("Headers with LogID functionality test completed")
-            
-        except Exception as e:
-            Log.error(f"Headers with LogID functionality test failed: {str(e)}")
-            Log.end_test("test_headers_with_logid", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_headers_with_logid", "PASSED")
     
     @allure.story("Integration with Framework Components")
     @allure.severity(allure.severity_level.CRITICAL)
@@ -375,16 +294,14 @@ class TestLogFunctionality:
         logid = generate_logid()
         Log.set_logid(logid)
         
-        # Step 2: Start test
-        Log.start_test("test_framework_integration")
-        
-        try:
+        # Step 2: Run test (start and end are logged as one record)
+        with Log.test("test_framework_integration"):
             Log.info("Testing integration with framework components")
             
             # Test integration with API client
             Log.info("Testing API client integration")
             response = self.api_client.get("/api/users")
-            Log.info("API call completed", {
+            Log.info("API call completed", data={
                 "status_code": response.status_code,
                 "url": "/api/users"
             })
@@ -392,14 +309,14 @@ class TestLogFunctionality:
             # Test integration with business operations
             Log.info("Testing business operations integration")
             result = self.user_ops.get_all_users()
-            Log.info("Business operation completed", {
+            Log.info("Business operation completed", data={
                 "result_keys": list(result.keys()) if isinstance(result, dict) else "Not a dict"
             })
             
             # Test integration with test data
             Log.info("Testing data integration")
             user_data = self.test_data.VALID_USER_1
-            Log.info("Test data retrieval completed", {"user_data": user_data})
+            Log.info("Test data retrieval completed", data={"user_data": user_data})
             
             # Validate data
             Checker.assert_field_value(user_data, "name", "John Smith")
@@ -407,14 +324,6 @@ class TestLogFunctionality:
             Checker.assert_field_value(user_data, "age", 25)
             
             Log.info("Framework components integration test completed")
-            
-        except Exception as e:
-            Log.error(f"Framework components integration test failed: {str(e)}")
-            Log.end_test("test_framework_integration", "FAILED")
-            raise
-        else:
-            # Final step: End test
-            Log.end_test("test_framework_integration", "PASSED")
 
 
 # Standalone test functions
@@ -424,10 +333,8 @@ def test_standalone_log_functionality():
     logid = generate_logid()
     Log.set_logid(logid)
     
-    # Step 2: Start test
-    Log.start_test("test_standalone_log_functionality")
-    
-    try:
+    # Step 2: Run test (start and end are logged as one record)
+    with Log.test("test_standalone_log_functionality"):
         Log.info("Starting standalone logging functionality test")
         
         # Test basic logging
@@ -444,14 +351,6 @@ def test_standalone_log_functionality():
         Log.data_validation("Health status", "ok", "ok", True)
         
         Log.info("Standalone logging functionality test completed")
-        
-    except Exception as e:
-        Log.error(f"Standalone logging functionality test failed: {str(e)}")
-        Log.end_test("test_standalone_log_functionality", "FAILED")
-        raise
-    else:
-        # Final step: End test
-        Log.end_test("test_standalone_log_functionality", "PASSED")
 
 
 def test_logid_consistency_across_calls():
@@ -460,19 +359,19 @@ def test_logid_consistency_across_calls():
     logid = generate_logid()
     Log.set_logid(logid)
     
-    # Step 2: Start test
-    Log.start_test("test_logid_consistency_across_calls")
-    
-    try:
+    # Step 2: Run test (start and end are logged as one record)
+    with Log.test("test_logid_consistency_across_calls"):
         # Record initial LogID
         initial_logid = Log.get_logid()
         Log.info(f"Initial LogID: {initial_logid}")
         
         # Multiple calls to logging methods, verify LogID consistency
+        # (bound locally to avoid repeated global/attribute lookups in the loop)
+        info, get_logid, assert_equal = Log.info, Log.get_logid, Checker.assert_equal
         for i in range(5):
-            Log.info(f"Log call #{i+1}")
-            current_logid = Log.get_logid()
-            Checker.assert_equal(current_logid, initial_logid, f"LogID at call {i+1}")
+            info(f"Log call #{i+1}")
+            current_logid = get_logid()
+            assert_equal(current_logid, initial_logid, f"LogID at call {i+1}")
         
         # Call different types of logging methods
         Log.warning("Warning log test")
@@ -488,14 +387,6 @@ def test_logid_consistency_across_calls():
         Checker.assert_equal(Log.get_logid(), initial_logid, "LogID after assertion")
         
         Log.info("LogID consistency test completed")
-        
-    except Exception as e:
-        Log.error(f"LogID consistency test failed: {str(e)}")
-        Log.end_test("test_logid_consistency_across_calls", "FAILED")
-        raise
-    else:
-        # Final step: End test
-        Log.end_test("test_logid_consistency_across_calls", "PASSED")
 
 
 if __name__ == "__main__":